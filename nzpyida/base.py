@@ -73,7 +73,8 @@ class IdaDataBase(object):
     IdaDataFrame per connection.
     """
 
-    def __init__(self, dsn, uid='', pwd='', autocommit=True, verbose=False):
+    def __init__(self, dsn, uid='', pwd='', autocommit=True, verbose=False,
+                 odbc_packet_size=None, arrow_odbc=False):
         """
         Open a database connection.
 
@@ -95,6 +96,20 @@ class IdaDataBase(object):
         verbose : bool, defaukt: True
             If True, prints all SQL requests that are sent to the database. 
 
+        odbc_packet_size : int, optional
+            Network packet size in bytes, set as SQL_ATTR_PACKET_SIZE before
+            an ODBC connection is opened. Larger packets increase the
+            throughput of large results on slow links. By default, the
+            packet size of the driver is used. Ignored for JDBC and NZPY.
+
+        arrow_odbc : bool, default: False
+            If True, the results of SELECT queries are fetched in columnar
+            batches with the optional dependency arrow-odbc instead of
+            pandas' read_sql, which is faster for large results. arrow-odbc
+            uses a second ODBC connection, opened on the first query, so
+            it is only used while the connection is in autocommit mode.
+            Ignored for JDBC and NZPY.
+
         Attributes
         ----------
         data_source_name : str
@@ -106,6 +121,16 @@ class IdaDataBase(object):
         _connection_string : str
             Connection string use for connecting via ODBC or JDBC or NZPY.
 
+        _odbc_attrs_before : dict
+            ODBC connection attributes set before connecting, e.g. the
+            packet size.
+
+        _arrow_odbc : bool
+            Whether query results are fetched with arrow-odbc.
+
+        _arrow_odbc_con : arrow_odbc.Connection
+            Connection used by arrow-odbc, None until it is opened.
+
         _con : connection object
             Connection object to the remote Database.
 
@@ -228,6 +253,8 @@ class IdaDataBase(object):
 
 
         self._idadfs = []
+        self._arrow_odbc = False
+        self._arrow_odbc_con = None
 
 
 
@@ -312,9 +339,24 @@ class IdaDataBase(object):
             SQL_DBCLOB to SQL_WLONGVARCHAR
             """
 
+            self._odbc_attrs_before = {}
+            if odbc_packet_size is not None:
+                if isinstance(odbc_packet_size, bool) or not isinstance(odbc_packet_size, int):
+                    raise TypeError("odbc_packet_size must be an integer")
+                if odbc_packet_size <= 0:
+                    raise ValueError("odbc_packet_size must be positive")
+                self._odbc_attrs_before[sql._SQL_ATTR_PACKET_SIZE] = odbc_packet_size
+
+            if arrow_odbc:
+                if sql._import_arrow_odbc() is None:
+                    raise ImportError("Please install optional dependency arrow-odbc "+
+                                      "to fetch query results with it.")
+                self._arrow_odbc = True
+
             import pyodbc
             try:
-                self._con = pyodbc.connect(self._connection_string, autocommit=autocommit)
+                self._con = pyodbc.connect(self._connection_string, autocommit=autocommit,
+                                           attrs_before=self._odbc_attrs_before)
                 self._con.setdecoding(pyodbc.SQL_CHAR, encoding='utf-8')
                 self._con.setdecoding(pyodbc.SQL_WCHAR, encoding='utf-8')
                 self._con.setencoding(encoding='utf-8')
@@ -554,6 +596,48 @@ class IdaDataBase(object):
           query = "SELECT TRIM(CURRENT_SCHEMA) FROM SYSIBM.SYSDUMMY1"
         return self.ida_scalar_query(query)
 
+    @lazy
+    def cache_geo_column_types(self):
+        """
+        Cache of the geometry types probed for geometry columns, so that
+        IdaGeoSeries and IdaGeoDataFrames built on the same column do not
+        query the database again. Keys are built by
+        nzpyida.geo_series._geometry_type_cache_key.
+
+        Returns
+        -------
+        dict
+        """
+        return dict()
+
+    @lazy
+    def cache_geo_column_srids(self):
+        """
+        Cache of the spatial reference system identifiers probed for
+        geometry columns, so that binary geospatial operations check them
+        without querying the database again. Keys are (name of the table or
+        view selecting the rows, column name) tuples.
+
+        Returns
+        -------
+        dict
+        """
+        return dict()
+
+    @lazy
+    def cache_geo_binary_views(self):
+        """
+        Cache of the views created by the binary geospatial operations of
+        IdaGeoDataFrame, so that repeating an operation on the same data
+        reuses its view instead of creating a new one. Keys are the view
+        expressions, values are the view names.
+
+        Returns
+        -------
+        dict
+        """
+        return dict()
+
     def show_tables(self, show_all=False):
         """
         Show tables and views that are available in self. By default, this 
@@ -1515,7 +1599,7 @@ class IdaDataBase(object):
             idadf.indexer = column_id
 
         # Reset attributes
-        idadf._reset_attributes(['shape', 'axes', 'dtypes'])
+        idadf._reset_attributes(['shape', 'axes', 'dtypes', '_wkb_values'])
 
     def delete_column(self, idadf, column_name, destructive=False):
         """
@@ -1668,7 +1752,7 @@ class IdaDataBase(object):
             except:
                 raise
 
-        idadf._reset_attributes(['shape', 'axes', 'dtypes', 'index'])
+        idadf._reset_attributes(['shape', 'axes', 'dtypes', 'index', '_wkb_values'])
 
     ###############################################################################
     #### Connection management
@@ -1707,7 +1791,8 @@ class IdaDataBase(object):
         self._con.rollback()
         if os.getenv('VERBOSE') == 'True':
             print("<< ROLLBACK >>")
-        self._reset_attributes("cache_show_tables")
+        # Views created since the last commit are discarded
+        self._reset_attributes(["cache_show_tables", "cache_geo_binary_views"])
 
     def close(self):
         """
@@ -1725,7 +1810,10 @@ class IdaDataBase(object):
             self.commit()
         else:
             self.rollback()
-        self._reset_attributes("cache_show_tables")
+        self._reset_attributes(["cache_show_tables", "cache_geo_column_types",
+                                "cache_geo_column_srids", "cache_geo_binary_views"])
+        # The connection of arrow-odbc is closed when it is released
+        self._arrow_odbc_con = None
         self._con.close()
         print("Connection closed.")
 
@@ -1738,8 +1826,10 @@ class IdaDataBase(object):
         except IdaDataBaseError:
             if self._con_type == 'odbc':
                 import pyodbc
+                self._arrow_odbc_con = None
                 try:
-                    self._con = pyodbc.connect(self._connection_string)
+                    self._con = pyodbc.connect(self._connection_string,
+                                               attrs_before=self._odbc_attrs_before)
                 except:
                     raise
                 else:
@@ -1877,7 +1967,8 @@ class IdaDataBase(object):
                     else:
                         raise e # let the expection raise anyway
         else:
-            self._reset_attributes("cache_show_tables")
+            self._reset_attributes(["cache_show_tables", "cache_geo_column_types",
+                                    "cache_geo_column_srids", "cache_geo_binary_views"])
             return True
 
     def _upper_columns(self, dataframe):
@@ -2267,7 +2358,7 @@ class IdaDataBase(object):
 
         for idadf in self._idadfs:
             if idadf._name == tablename:
-                idadf._reset_attributes(["shape", "index"])
+                idadf._reset_attributes(["shape", "index", "_wkb_values"])
 
     def _prepare_and_execute(self, query, autocommit=True, silent=False):
         """
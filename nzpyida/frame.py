@@ -154,7 +154,15 @@ class IdaDataFrame(object):
                 raise NameError("Table %s does not exist in the database %s."
                                 %(tablename, idadb.data_source_name))
 
+        self._init_attributes(idadb, tablename, indexer)
 
+    def _init_attributes(self, idadb, tablename, indexer):
+        """
+        Initializes the attributes of an IdaDataFrame opened on tablename,
+        without checking that the table or view exists. Used by __init__ once
+        the check is done, and by constructors of objects whose table is
+        already known to exist.
+        """
         self._idadb = idadb
         self._indexer = indexer
 
@@ -14,13 +14,123 @@ IdaGeoDataFrame
 """
 import nzpyida
 from nzpyida.frame import IdaDataFrame
-from nzpyida.geo_series import IdaGeoSeries
+from nzpyida.geo_series import (IdaGeoSeries, _geometry_type_cache_key,
+                                _UNARY_OPERATIONS)
 from nzpyida.exceptions import IdaGeoDataFrameError
+from nzpyida.sql import _prepare_query
 from nzpy.core import ProgrammingError
 
-from copy import deepcopy
+from collections import OrderedDict
+from copy import copy
+from functools import wraps
 
+import numpy as np
 import six
+from pandas import DataFrame, Index
+
+# Attribute names of IdaGeoSeries, looked up on each attribute miss of
+# IdaGeoDataFrame to forward geospatial methods to its geometry column
+_IDAGEOSERIES_ATTRIBUTES = frozenset(dir(IdaGeoSeries))
+
+# Database function and mbr_disjoint_result option of each binary geospatial
+# method, filled by _binary_operation. distance is declared here because it
+# is not generated, due to its unit argument
+_BINARY_OPERATIONS = {'distance': ('inza..ST_DISTANCE', None)}
+
+
+def _binary_operation(function_name, mbr_disjoint_result=None):
+    """
+    Decorator generating a binary geospatial method of IdaGeoDataFrame
+    which calls the database function function_name on the geometries of
+    both IdaGeoDataFrames. The decorated method only carries the signature
+    and the documentation, its body is never executed.
+    See IdaGeoDataFrame._binary_operation_handler for mbr_disjoint_result.
+    """
+    def decorator(method):
+        _BINARY_OPERATIONS[method.__name__] = (function_name, mbr_disjoint_result)
+
+        @wraps(method)
+        def binary_operation(self, ida2):
+            return self._binary_operation_handler(
+                ida2,
+                function_name=function_name,
+                mbr_disjoint_result=mbr_disjoint_result)
+        return binary_operation
+    return decorator
+
+
+def _quote_identifier(name):
+    """
+    Returns name as a delimited SQL identifier. Double quotes in name are
+    doubled, so that they can't end the identifier.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _binary_operation_columns(indexer, geometry_column):
+    """
+    Returns the select list of the columns of an IdaGeoDataFrame read by a
+    binary geospatial operation: its indexer and its geometry column.
+    """
+    if geometry_column == indexer:
+        return _quote_identifier(indexer)
+    return _quote_identifier(indexer) + ',' + _quote_identifier(geometry_column)
+
+
+def _numeric_array(series):
+    """
+    Returns the values of a pandas Series as a NumPy array, converted to
+    float64 if they are Python objects which are all numbers or None.
+    """
+    array = series.to_numpy()
+    if array.dtype == object:
+        try:
+            return array.astype(np.float64)
+        except (TypeError, ValueError):
+            pass
+    return array
+
+
+class _BinaryOperationBatch(object):
+    """
+    Context manager returned by IdaGeoDataFrame.batch. Records the binary
+    geospatial methods called on it and computes them with a single
+    binary_ops view when the context exits.
+    """
+    def __init__(self, ida1, ida2):
+        """
+        Attributes
+        ----------
+        operations : list of str
+            Names of the binary geospatial methods called so far.
+        result : IdaGeoDataFrame
+            Result of binary_ops, None until the context exits.
+        """
+        self._ida1 = ida1
+        self._ida2 = ida2
+        self.operations = []
+        self.result = None
+
+    def __getattr__(self, name):
+        """
+        Returns a method recording the binary geospatial operation name,
+        which returns the name of its column in the result.
+        """
+        if name not in _BINARY_OPERATIONS:
+            raise AttributeError(name)
+
+        def record_operation():
+            if name not in self.operations:
+                self.operations.append(name)
+            return 'RESULT_' + name.upper()
+        return record_operation
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ex_type, value, traceback):
+        if ex_type is None and self.operations:
+            self.result = self._ida1.binary_ops(self._ida2, self.operations)
 
 
 class IdaGeoDataFrame(IdaDataFrame):
@@ -121,6 +231,9 @@ class IdaGeoDataFrame(IdaDataFrame):
         _geometry_colname : str
             Name of the column that "geometry" property refers to.
             This attribute must be set through the set_geometry() method.
+        _geometry_cache : tuple
+            IdaGeoSeries copied by the "geometry" property, with the state
+            of the IdaGeoDataFrame it was built for.
         geometry : IdaGeoSeries
             The column referenced by _geometry_colname attribute.
         """      
@@ -129,6 +242,7 @@ class IdaGeoDataFrame(IdaDataFrame):
             raise TypeError("geometry must be a string")
         super(IdaGeoDataFrame, self).__init__(idadb, tablename, indexer)
         self._geometry_colname = None
+        self._geometry_cache = None
         if geometry is not None:
             self.set_geometry(geometry)
 
@@ -175,6 +289,7 @@ class IdaGeoDataFrame(IdaDataFrame):
         Erases the "geometry" property if the column it refers to is deleted.
         """
         super(IdaGeoDataFrame, self).__delitem__(item)
+        self._geometry_cache = None
         if item == self._geometry_colname:
             self._geometry_colname = None
 
@@ -194,14 +309,13 @@ class IdaGeoDataFrame(IdaDataFrame):
             # When .geometry is accessed and _geometry_colname is None
             return self.__getattribute__('geometry')
 
-        if hasattr(IdaGeoSeries, name):
+        if name in _IDAGEOSERIES_ATTRIBUTES:
             # Geospatial method call
             if self._geometry_colname is None:
                 raise AttributeError("Geometry column has not been set yet.")
             else:
                 # Get a IdaGeoSeries and carry the operation on it
-                idageoseries = self.__getitem__(item = self._geometry_colname)
-                return idageoseries.__getattribute__(name)
+                return self.geometry.__getattribute__(name)
         else:
             raise AttributeError
     
@@ -223,12 +337,41 @@ class IdaGeoDataFrame(IdaDataFrame):
             If the property has not been set yet.
         
         """
+        column_name = self._geometry_column_name()
+        # Building the IdaGeoSeries checks the geometry type of the column,
+        # it is kept as long as the IdaGeoDataFrame is not modified
+        state = (column_name, self.internal_state.get_state(),
+                 str(self.internal_state.order),
+                 str(self.internal_state.ascending))
+        if self._geometry_cache is None or self._geometry_cache[0] != state:
+            self._geometry_cache = (state, self.__getitem__(column_name))
+        # A copy is returned, so that modifying it doesn't modify the cached
+        # IdaGeoSeries. Its geometry type is found in the cache of the
+        # IdaDataBase, without querying the database again
+        return IdaGeoSeries.from_IdaSeries(self._geometry_cache[1]._clone())
+
+    def _geometry_column_name(self):
+        """
+        Returns the name of the column of the "geometry" property, without
+        building its IdaGeoSeries. The type of the column was checked when
+        it was set by set_geometry.
+
+        Raises
+        ------
+        AttributeError
+            If the property has not been set yet.
+        KeyError
+            If the column is not a column of the IdaGeoDataFrame anymore.
+        """
         if self._geometry_colname is None:
             raise AttributeError(
                 "Geometry property has not been set yet. "
                 "Use set_geometry method to set it.")
-        else:
-            return self.__getitem__(self._geometry_colname)
+        # The column may have been removed without __delitem__, e.g. by
+        # renaming the columns
+        if self._geometry_colname not in self.columns:
+            raise KeyError(self._geometry_colname)
+        return self._geometry_colname
     
     @geometry.setter
     def geometry(self, value):
@@ -260,20 +403,60 @@ class IdaGeoDataFrame(IdaDataFrame):
             # TODO: check if it's better to only change the .__base__ attribute
 
             #behavior based on _clone() method of IdaDataFrame
-            newida = IdaGeoDataFrame(
-                    idadf._idadb, idadf._name, idadf.indexer, geometry)
-            
-            newida.internal_state.name = deepcopy(idadf.internal_state.name)
-            newida.internal_state.ascending = deepcopy(idadf.internal_state.ascending)
-            #newida.internal_state.views = deepcopy(idadf.internal_state.views)
-            newida.internal_state._views = deepcopy(idadf.internal_state._views)
-            newida.internal_state._cumulative = deepcopy(idadf.internal_state._cumulative)
-            newida.internal_state.order = deepcopy(idadf.internal_state.order)
-            newida.internal_state.columndict = deepcopy(idadf.internal_state.columndict)
-            newida.columns = idadf.columns 
-            newida.dtypes = idadf.dtypes
+            newida = cls._from_known_schema(
+                    idadf._idadb, idadf._name, idadf.indexer,
+                    idadf.columns, idadf.dtypes)
+
+            # The internal state only holds strings, so copying the containers
+            # is enough to keep both objects independent, no deepcopy needed
+            state = idadf.internal_state
+            newida.internal_state.name = state.name
+            newida.internal_state.ascending = state.ascending
+            newida.internal_state._views = list(state._views)
+            newida.internal_state._cumulative = list(state._cumulative)
+            newida.internal_state.order = copy(state.order)
+            newida.internal_state.columndict = OrderedDict(state.columndict)
+            newida._org_columns_names = copy(idadf._org_columns_names)
+
+            # Set the geometry once the state is copied, so that the geometry
+            # type is probed on the data the IdaGeoDataFrame refers to
+            if geometry is not None:
+                newida.set_geometry(geometry)
             return newida
 
+    @classmethod
+    def _from_known_schema(cls, idadb, tablename, indexer, columns, dtypes=None):
+        """
+        Creates an IdaGeoDataFrame on a table or view which is known to
+        exist, with known columns and dtypes, without querying the database
+        to check the table or to fetch its schema.
+
+        Parameters
+        ----------
+        tablename : str
+            Name of the table or view, qualified by its schema.
+        columns : Index
+            Columns of the table or view.
+        dtypes : DataFrame, optional
+            Data types of the columns, as returned by IdaDataFrame.dtypes.
+            If None, they are fetched from the database when needed.
+
+        Returns
+        -------
+        IdaGeoDataFrame
+            With no geometry set.
+        """
+        newida = cls.__new__(cls)
+        newida._init_attributes(idadb, tablename, indexer)
+        newida._geometry_colname = None
+        newida._geometry_cache = None
+        # Fill the lazy attributes directly, the columns setter would query
+        # the database again to rename the columns to themselves
+        newida.get_columns = columns
+        if dtypes is not None:
+            newida.dtypes = dtypes
+        return newida
+
     def set_geometry(self, column_name):
         """
         Receives a column name to set as the "geometry" column of the
@@ -298,21 +481,61 @@ class IdaGeoDataFrame(IdaDataFrame):
             raise KeyError( "'" + column_name + "' cannot be set as geometry column: "
                 "not a column in the IdaGeoDataFrame.")
         
-        is_geometry_type = True
-        try: 
-            idaseries = IdaGeoSeries.from_IdaSeries(self[column_name])
-            self.geo_column_data_type = idaseries.column_data_type
-        except TypeError:
-            raise TypeError("'" + column_name + "' cannot be set as geometry column: "
-                "specified column doesn't have geometry type")
-
-        del idaseries
-        
+        # The geometry type probe is a round-trip to the database, its result
+        # is cached in the parent IdaDataBase by IdaGeoSeries
+        geo_column_types = self._idadb.cache_geo_column_types
+        cache_key = _geometry_type_cache_key(self, column_name)
+        if cache_key not in geo_column_types:
+            try:
+                IdaGeoSeries.from_IdaSeries(self[column_name])
+            except TypeError:
+                raise TypeError("'" + column_name + "' cannot be set as geometry column: "
+                    "specified column doesn't have geometry type")
+
+        self.geo_column_data_type = geo_column_types[cache_key]
         self._geometry_colname = column_name
+        self._geometry_cache = None
+
+    def select_geometries(self):
+        """
+        Returns an IdaGeoDataFrame with only the indexer and the "geometry"
+        column of the IdaGeoDataFrame, so that fetching it, or the columns
+        derived from its geometries, doesn't transfer the other columns of
+        the table.
+
+        Returns
+        -------
+        IdaGeoDataFrame
+            With the same "geometry" column.
+
+        Raises
+        ------
+        AttributeError
+            If the "geometry" column has not been set.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer='OBJECTID', geometry='SHAPE')
+        >>> shapes = counties.select_geometries()
+        >>> shapes['CENTROID'] = shapes.centroid()
+        >>> shapes.columns
+        Index(['OBJECTID', 'SHAPE', 'CENTROID'], dtype='object')
+        """
+        geometry_column = self._geometry_column_name()
+        columns = [geometry_column]
+        if self.indexer is not None and self.indexer != geometry_column:
+            columns.insert(0, self.indexer)
+        # The geometry type is cached, setting the geometry doesn't query it
+        return IdaGeoDataFrame.from_IdaDataFrame(
+            super(IdaGeoDataFrame, self).__getitem__(columns),
+            geometry=geometry_column)
 
     # ==============================================================================
     ### Binary geospatial methods
     # ==============================================================================
+    # Two empty geometries are equal, but their bounding rectangles don't
+    # intersect, so equals has no mbr_disjoint_result
+    @_binary_operation('inza..ST_EQUALS')
     def equals(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -357,9 +580,6 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         0
         2            109          0
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_EQUALS')
 
     def distance(self, ida2, unit=None):
         """
@@ -415,7 +635,7 @@ class IdaGeoDataFrame(IdaDataFrame):
         """
         add_args = None
         if unit is not None:
-            unit = self._check_linear_unit(unit)  # Can raise exceptions
+            unit = IdaGeoSeries._check_linear_unit(unit)  # Can raise exceptions
             add_args = []
             add_args.append(unit)
         return self._binary_operation_handler(
@@ -423,6 +643,7 @@ class IdaGeoDataFrame(IdaDataFrame):
             function_name='inza..ST_DISTANCE',
             additional_args = add_args)
 
+    @_binary_operation('inza..ST_CROSSES', mbr_disjoint_result='0')
     def crosses(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -470,10 +691,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         0
         2            109          0
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_CROSSES')
 
+    @_binary_operation('inza..ST_INTERSECTS', mbr_disjoint_result='0')
     def intersects(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -517,10 +736,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         0
         2            109          0
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_INTERSECTS')
 
+    @_binary_operation('inza..ST_OVERLAPS', mbr_disjoint_result='0')
     def overlaps(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -565,10 +782,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         0
         2            109          0
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_OVERLAPS')
 
+    @_binary_operation('inza..ST_TOUCHES', mbr_disjoint_result='0')
     def touches(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -612,10 +827,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         0
         2            109          0
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_TOUCHES')
 
+    @_binary_operation('inza..ST_DISJOINT', mbr_disjoint_result='1')
     def disjoint(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -659,10 +872,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         1
         2            109          1
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_DISJOINT')
 
+    @_binary_operation('inza..ST_CONTAINS', mbr_disjoint_result='0')
     def contains(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -709,10 +920,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         21417          134            1
         21419          134            1
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_CONTAINS')
 
+    @_binary_operation('inza..ST_WITHIN', mbr_disjoint_result='0')
     def within(self, ida2):
         """
         Valid types for the column in the calling IdaGeoDataFrame:
@@ -759,10 +968,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         134            21417          1
         134            21419          1
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_WITHIN')
 
+    @_binary_operation('inza..ST_MBRINTERSECTS')
     def mbr_intersects(self, ida2):
         """
         This method takes a second IdaGeoDataFrame an an input
@@ -805,10 +1012,9 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         0
         2            109          0
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_MBRINTERSECTS')
 
+    @_binary_operation('inza..ST_DIFFERENCE',
+                       mbr_disjoint_result='{geometry1}')
     def difference(self, ida2):
         """
         This method takes a second IdaGeoDataFrame an an input
@@ -819,6 +1025,11 @@ class IdaGeoDataFrame(IdaDataFrame):
         For None geometries the output is None.
         For empty geometries the output is None.
 
+        If the minimum bounding rectangles of two non-empty geometries don't
+        intersect, ST_DIFFERENCE() is not called and the geometry of the
+        calling IdaGeoDataFrame is returned as it is, not normalized by the
+        function.
+
         Returns
         -------
         Returns an IdaGeoDataFrame with three columns:
@@ -850,10 +1061,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         <Geometry binary data>
         2            109          <Geometry binary data>
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_DIFFERENCE')
 
+    @_binary_operation('inza..ST_INTERSECTION')
     def intersection(self, ida2):
         """
         This method takes a second IdaGeoDataFrame an an input
@@ -895,10 +1104,8 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         POINT EMPTY
         2            109          POINT EMPTY
         """
-        return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_INTERSECTION')
 
+    @_binary_operation('inza..ST_UNION')
     def union(self, ida2):
         """
         This method takes a second IdaGeoDataFrame an an input
@@ -940,13 +1147,526 @@ class IdaGeoDataFrame(IdaDataFrame):
         2            1840         <Geometry binary data>
         2            109          <Geometry binary data>
         """
+
+    def binary_ops(self, ida2, operations, intersecting_mbrs_only=False):
+        """
+        Computes several binary geospatial operations between the
+        geometries of two IdaGeoDataFrames in a single query, so that the
+        geometries are read only once.
+
+        Returns
+        -------
+        Returns an IdaGeoDataFrame with one result column per operation:
+
+        INDEXERIDA1 : indexer of the first IdaGeoSeries,
+        INDEXERIDA2 : indexer of the second IdaGeoSeries,
+        RESULT_<OPERATION> : the result of each operation, e.g.
+        RESULT_INTERSECTS for intersects
+
+        Parameters
+        ----------
+        ida2 : IdaGeoDataFrame
+            Second IdaGeoDataFrame of the operations.
+        operations : list of str
+            Names of the binary geospatial methods of IdaGeoDataFrame to
+            compute, e.g. ['intersects', 'touches', 'distance']. distance
+            is computed without a unit argument.
+        intersecting_mbrs_only : bool, default: False
+            If True, only the pairs of geometries whose minimum bounding
+            rectangles intersect are returned, instead of every pair. This
+            suits spatial joins, where the other pairs are not candidates.
+
+        Raises
+        ------
+        ValueError
+            If an operation is not a binary geospatial method.
+
+        Notes
+        -----
+        The operations are computed by one query, instead of one join of
+        the two IdaGeoDataFrames per operation.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> ida1 = counties[counties['NAME'] == 'Austin']
+        >>> ida2 = counties[counties['NAME'] == 'Kent']
+        >>> result = ida1.binary_ops(ida2, ['intersects', 'touches', 'distance'])
+        >>> result.head()
+        INDEXERIDA1  INDEXERIDA2  RESULT_INTERSECTS  RESULT_TOUCHES  RESULT_DISTANCE
+        2            163          0                  0               0.242004
+        2            1840         0                  0               0.043772
+        2            109          0                  0               0.147332
+        """
+        if isinstance(operations, six.string_types):
+            operations = [operations]
+        if not operations:
+            raise ValueError("operations must contain at least one operation")
+        result_columns = OrderedDict()
+        for operation in operations:
+            if operation not in _BINARY_OPERATIONS:
+                raise ValueError("'" + str(operation) + "' is not a binary "
+                    "geospatial operation, valid operations are: " +
+                    ", ".join(sorted(_BINARY_OPERATIONS)))
+            function_name, mbr_disjoint_result = _BINARY_OPERATIONS[operation]
+            result_columns['RESULT_' + operation.upper()] = (
+                function_name, None, mbr_disjoint_result)
         return self._binary_operation_handler(
-            ida2,
-            function_name='inza..ST_UNION')
+            ida2, result_columns=result_columns,
+            intersecting_mbrs_only=intersecting_mbrs_only)
+
+    def drop_empty(self):
+        """
+        Returns the rows of the IdaGeoDataFrame whose geometry is neither
+        None nor empty. The rows are filtered in the database, so that the
+        geospatial methods, which return None for such geometries, are not
+        evaluated on them and their None results are not transferred.
+
+        Returns
+        -------
+        IdaGeoDataFrame
+            With the same "geometry" column.
+
+        Raises
+        ------
+        AttributeError
+            If the "geometry" column has not been set.
+
+        Examples
+        --------
+        >>> sample_points = IdaGeoDataFrame(idadb, 'SAMPLE_POINTS', indexer='ID', geometry='LOC')
+        >>> points = sample_points.drop_empty()
+        >>> points['X'] = points.x()
+        """
+        geometry_column = self._geometry_column_name()
+        column = _quote_identifier(geometry_column)
+        filter_query = nzpyida.filtering.FilterQuery(
+            geometry_column, self._name, 'eq', 0)
+        # The condition can't be expressed with a comparison operator, the
+        # where clause is replaced like the operators of FilterQuery do
+        filter_query.wherestr = (
+            '(' + column + ' IS NOT NULL AND inza..ST_ISEMPTY(' + column +
+            ') = 0)')
+        idageodf = self[filter_query]
+        idageodf.set_geometry(geometry_column)
+        return idageodf
+
+    def unary_ops(self, operations):
+        """
+        Computes several unary geospatial operations on the geometries of
+        the IdaGeoDataFrame, which are fetched by a single SELECT.
+
+        Returns
+        -------
+        Returns the IdaGeoDataFrame returned by select_geometries, with one
+        result column per operation: RESULT_<OPERATION>, e.g. RESULT_MAX_X
+        for max_x. If operations is a dict, the IdaGeoDataFrame has the
+        indexer and the given geometry columns instead, with one result
+        column per column and operation: RESULT_<COLUMN>_<OPERATION>, e.g.
+        RESULT_SHAPE_MAX_X.
+
+        Parameters
+        ----------
+        operations : list of str or dict
+            Names of the geospatial methods of IdaGeoSeries to compute on
+            the "geometry" column, among those which can be called without
+            argument, e.g. ['max_x', 'max_y', 'area']. Methods with a unit
+            are computed without a unit argument. A dict maps names of
+            geometry columns to such lists, to compute the operations on
+            several geometry columns of the table in the same SELECT, e.g.
+            {'SHAPE': ['max_x'], 'LOCATION': ['x', 'y']}.
+
+        Raises
+        ------
+        ValueError
+            If an operation is not a unary geospatial method.
+        KeyError
+            If a column of the dict is not in the IdaGeoDataFrame.
+        TypeError
+            If a column of the dict doesn't have geometry type.
+        AttributeError
+            If operations is a list and the "geometry" column has not been
+            set.
+
+        Notes
+        -----
+        Like the columns derived from the geometries with the unary
+        geospatial methods, the operations don't query the database until
+        the result is fetched, e.g. with head().
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> result = counties.unary_ops(['min_x', 'max_x'])
+        >>> result.head()
+        OBJECTID  SHAPE                   RESULT_MIN_X  RESULT_MAX_X
+        1         <Geometry binary data>  -92.141130    -91.520920
+        2         <Geometry binary data>  -83.131870    -82.413040
+        """
+        if isinstance(operations, dict):
+            return self._unary_ops_by_column(operations)
+        operations = self._check_unary_operations(operations)
+        idageodf = self.select_geometries()
+        geometry = idageodf.geometry
+        for operation in operations:
+            idageodf['RESULT_' + operation.upper()] = getattr(geometry, operation)()
+        return idageodf
+
+    @staticmethod
+    def _check_unary_operations(operations):
+        """
+        Returns operations as a list, after checking that they are names of
+        unary geospatial methods of IdaGeoSeries.
+        """
+        if isinstance(operations, six.string_types):
+            operations = [operations]
+        if not operations:
+            raise ValueError("operations must contain at least one operation")
+        for operation in operations:
+            if operation not in _UNARY_OPERATIONS:
+                raise ValueError("'" + str(operation) + "' is not a unary "
+                    "geospatial operation, valid operations are: " +
+                    ", ".join(sorted(_UNARY_OPERATIONS)))
+        return list(operations)
+
+    def _unary_ops_by_column(self, operations):
+        """
+        Implements unary_ops for a dict of geometry columns and operations.
+        """
+        if not operations:
+            raise ValueError("operations must contain at least one column")
+        operations = OrderedDict(
+            (column, self._check_unary_operations(column_operations))
+            for column, column_operations in operations.items())
+        for column in operations:
+            if column not in self.columns:
+                raise KeyError("'" + str(column) + "' is not a column of "
+                               "the IdaGeoDataFrame")
+        columns = list(operations)
+        if self.indexer is not None and self.indexer not in columns:
+            columns.insert(0, self.indexer)
+        geometry_column = self._geometry_colname
+        if geometry_column not in operations:
+            geometry_column = columns[-len(operations)]
+        idageodf = IdaGeoDataFrame.from_IdaDataFrame(
+            super(IdaGeoDataFrame, self).__getitem__(columns),
+            geometry=geometry_column)
+        # The series are created before any result column is added, while
+        # the dtypes of the projection are known. Every result column is a
+        # function of a column of the same SELECT, so that they are all
+        # fetched together
+        geoseries = [IdaGeoSeries.from_IdaSeries(
+                         super(IdaGeoDataFrame, idageodf).__getitem__(column))
+                     for column in operations]
+        for idageoseries, (column, column_operations) in zip(
+                geoseries, operations.items()):
+            for operation in column_operations:
+                idageodf['RESULT_' + column.upper() + '_' + operation.upper()] = \
+                    getattr(idageoseries, operation)()
+        return idageodf
+
+    def accessors(self, operations):
+        """
+        Computes several unary geospatial operations on the geometries of
+        the IdaGeoDataFrame, and returns their results without the
+        geometries, in an IdaDataFrame whose columns are all defined at
+        once.
+
+        Parameters
+        ----------
+        operations : list of str
+            Names of the geospatial methods of IdaGeoSeries to compute,
+            among those which can be called without argument, e.g.
+            ['max_x', 'max_y', 'max_z', 'max_m']. Methods with a unit are
+            computed without a unit argument.
+
+        Returns
+        -------
+        IdaDataFrame
+            With the indexer of the IdaGeoDataFrame, if it has one, and one
+            column per operation, named after it in upper case, e.g. MAX_X
+            for max_x.
+
+        Raises
+        ------
+        ValueError
+            If an operation is not a unary geospatial method.
+        TypeError
+            If an operation doesn't accept the type of the geometries.
+        AttributeError
+            If the "geometry" column has not been set.
+
+        Notes
+        -----
+        Unlike unary_ops, which assigns the result columns one by one, the
+        columns of the IdaDataFrame are known when it is returned, so that
+        reading them doesn't query the database. Its data is fetched by a
+        single SELECT.
+
+        See also
+        --------
+        unary_ops, bounds, IdaGeoSeries.fetch_ops
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> counties.accessors(['num_points', 'area']).head(2)
+        OBJECTID  NUM_POINTS  AREA
+        1         57          0.046181
+        2         107         0.158791
+        """
+        operations = self._check_unary_operations(operations)
+        geometry_column = self._geometry_column_name()
+        geometry = self.geometry
+        columndict = OrderedDict()
+        if self.indexer is not None:
+            columndict[self.indexer] = self.internal_state.columndict[self.indexer]
+        for operation in operations:
+            result = getattr(geometry, operation)()
+            columndict[operation.upper()] = \
+                result.internal_state.columndict[result.column]
+
+        # The projection only provides the rows of the IdaGeoDataFrame, its
+        # columns are replaced by the results
+        ida = super(IdaGeoDataFrame, self).__getitem__(
+            [self.indexer if self.indexer is not None else geometry_column])
+        ida._reset_attributes(["get_columns", "shape", "dtypes"])
+        ida.internal_state.columns = ['"' + column + '"' for column in columndict]
+        ida.internal_state.columndict = columndict
+        ida.internal_state.update()
+        ida.get_columns = Index(list(columndict))
+        return ida
+
+    def bounds(self, z=False, m=False):
+        """
+        Returns the bounds of the geometries of the IdaGeoDataFrame, which
+        are computed by a single SELECT instead of one per coordinate.
+
+        Parameters
+        ----------
+        z : bool, default: False
+            If True, the bounds of the Z coordinates are also computed.
+        m : bool, default: False
+            If True, the bounds of the M coordinates are also computed.
+
+        Returns
+        -------
+        IdaDataFrame
+            With the indexer of the IdaGeoDataFrame and the columns MIN_X,
+            MIN_Y, MAX_X, MAX_Y, followed by MIN_Z, MAX_Z if z is True and
+            MIN_M, MAX_M if m is True. The geometries themselves are not
+            included, so that they are not transferred with the bounds.
+
+        Raises
+        ------
+        AttributeError
+            If the "geometry" column has not been set.
+
+        See also
+        --------
+        accessors, IdaGeoSeries.min_x, IdaGeoSeries.max_x, ...
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> counties.bounds().head()
+        OBJECTID  MIN_X       MIN_Y      MAX_X       MAX_Y
+        1         -92.141130  42.297020  -91.520920  42.645530
+        2         -83.131870  42.780680  -82.413040  43.591710
+        """
+        operations = ['min_x', 'min_y', 'max_x', 'max_y']
+        if z:
+            operations += ['min_z', 'max_z']
+        if m:
+            operations += ['min_m', 'max_m']
+        return self.accessors(operations)
+
+    def batch(self, ida2):
+        """
+        Returns a context manager which records the binary geospatial
+        methods called on it, and computes all of them with binary_ops
+        when the context exits, i.e. with one view over the pair of
+        IdaGeoDataFrames instead of one view per method.
+
+        Parameters
+        ----------
+        ida2 : IdaGeoDataFrame
+            Second IdaGeoDataFrame of the operations.
+
+        Returns
+        -------
+        Context manager whose methods take no argument and return the name
+        of their result column. Its result attribute is the IdaGeoDataFrame
+        returned by binary_ops, set when the context exits.
 
-    def _binary_operation_handler(self, ida2, function_name,
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> ida1 = counties[counties['NAME'] == 'Austin']
+        >>> ida2 = counties[counties['NAME'] == 'Kent']
+        >>> with ida1.batch(ida2) as batch:
+        ...     intersection = batch.intersection()
+        ...     union = batch.union()
+        >>> batch.result[['INDEXERIDA1', 'INDEXERIDA2', union]].head()
+        INDEXERIDA1  INDEXERIDA2  RESULT_UNION
+        2            163          <Geometry binary data>
+        2            1840         <Geometry binary data>
+        2            109          <Geometry binary data>
+        """
+        return _BinaryOperationBatch(self, ida2)
+
+    def apply_numba(self, func, columns='RESULT'):
+        """
+        Downloads numeric columns, typically the RESULT column of a binary
+        geospatial operation such as distance, and applies on them a
+        function compiled with numba, which avoids a Python loop over the
+        rows. Geometry columns cannot be passed to the function.
+
+        Parameters
+        ----------
+        func : function
+            Function taking one NumPy array per column, in the order of
+            columns. It must be supported by numba.njit.
+        columns : str or list of str, default: 'RESULT'
+            Columns to download and to pass to func.
+
+        Returns
+        -------
+        The value returned by func.
+
+        Raises
+        ------
+        KeyError
+            If a column is not present in the IdaGeoDataFrame.
+
+        Notes
+        -----
+        numba is an optional dependency. If it is not installed, func is
+        called on the NumPy arrays without being compiled.
+
+        Columns fetched as Python objects, e.g. DECIMAL values or numbers
+        with None for empty geometries, are passed as float64 arrays with
+        NaN for None, which numba compiles, instead of object arrays.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> ida1 = counties[counties['NAME'] == 'Austin']
+        >>> result = ida1.distance(counties, unit='KILOMETER')
+        >>> def count_close(distances):
+        ...     count = 0
+        ...     for distance in distances:
+        ...         if distance < 50:
+        ...             count += 1
+        ...     return count
+        >>> result.apply_numba(count_close)
+        9
+        """
+        if isinstance(columns, six.string_types):
+            columns = [columns]
+        for column in columns:
+            if column not in self.columns:
+                raise KeyError("'" + column + "' is not a column in the "
+                    "IdaGeoDataFrame.")
+        try:
+            import numba
+        except ImportError:
+            compiled_func = func
+        else:
+            compiled_func = numba.njit(func)
+
+        data = self[columns].as_dataframe()
+        return compiled_func(*[_numeric_array(data[column]) for column in columns])
+
+    def stream(self, chunksize=1000):
+        """
+        Downloads the IdaGeoDataFrame chunk by chunk, so that large results
+        of geospatial operations, whose geometries can be large, don't need
+        to reside in memory at once as with as_dataframe.
+
+        Parameters
+        ----------
+        chunksize : int > 0, default: 1000
+            Number of rows of each chunk.
+
+        Returns
+        -------
+        Generator of DataFrames, whose columns are the columns of the
+        IdaGeoDataFrame.
+
+        Raises
+        ------
+        ValueError
+            If chunksize is not an int greater than 0.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb,'SAMPLES.GEO_COUNTY',indexer='OBJECTID')
+        >>> counties.set_geometry('SHAPE')
+        >>> result = counties.intersection(counties)
+        >>> for chunk in result.stream(chunksize=10000):
+        ...     process(chunk)
+        """
+        if not isinstance(chunksize, six.integer_types) or chunksize < 1:
+            raise ValueError("Parameter chunksize should be an int greater than 0.")
+        # Validate the arguments before the first chunk is requested
+        return self._stream(chunksize)
+
+    def _stream(self, chunksize):
+        """
+        Generator of the chunks of stream.
+        """
+        columns = list(self.columns)
+        query = _prepare_query(self.internal_state.get_state())
+        self._idadb._check_connection()
+        cursor = self._idadb._con.cursor()
+        try:
+            cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(chunksize)
+                if not rows:
+                    break
+                yield DataFrame([tuple(row) for row in rows], columns=columns)
+        finally:
+            cursor.close()
+
+    def _geometry_srid(self):
+        """
+        Returns the spatial reference system identifier of the geometry
+        column, read from a single row, the first one whose geometry is not
+        None. The other rows are not checked. The identifier is cached in
+        the parent IdaDataBase for the current state of the
+        IdaGeoDataFrame, i.e. the view selecting its rows, and the column.
+
+        Returns
+        -------
+        int, or None if the column has no geometry.
+        """
+        geo_column_srids = self._idadb.cache_geo_column_srids
+        column = self._geometry_column_name()
+        cache_key = (self.name, column)
+        if cache_key not in geo_column_srids:
+            quoted_column = _quote_identifier(column)
+            query = ("SELECT inza..ST_SRID(%s) FROM %s "
+                     "WHERE %s IS NOT NULL LIMIT 1" %(quoted_column, self.name, quoted_column))
+            row = self._idadb.ida_query(query, first_row_only=True)
+            if not row:
+                # Not cached, geometries may be inserted later
+                return None
+            geo_column_srids[cache_key] = row[0]
+        return geo_column_srids[cache_key]
+
+    def _binary_operation_handler(self, ida2, function_name=None,
                                           valid_types_ida1=None, valid_types_ida2=None,
-                                          additional_args=None):
+                                          additional_args=None, mbr_disjoint_result=None,
+                                          result_columns=None,
+                                          intersecting_mbrs_only=False):
 
 
         """
@@ -968,61 +1688,147 @@ class IdaGeoDataFrame(IdaDataFrame):
                 Valid input typenames for the second IdaGeoSeries.
         additional_args : list of str, optional
                 Additional arguments for the function.
+        mbr_disjoint_result : str, optional
+                SQL expression of the result for pairs of geometries whose
+                minimum bounding rectangles don't intersect, in which case
+                the function is not evaluated. The first geometry can be
+                referred to as {geometry1}, the result is then only used
+                for pairs of non-empty geometries. Only valid if the
+                function always returns this result for geometries that
+                don't intersect. If None, the function is evaluated for all
+                pairs.
+        result_columns : OrderedDict, optional
+                Several functions to compute in the same query, instead of
+                function_name, additional_args and mbr_disjoint_result. Maps
+                the name of each result column to a tuple (function_name,
+                additional_args, mbr_disjoint_result).
+        intersecting_mbrs_only : bool, default: False
+                If True, only the pairs of geometries whose minimum bounding
+                rectangles intersect are returned.
 
         Returns
         -------
         IdaGeoDataFrame
+
+        Notes
+        -----
+        The handler only creates a view, the functions are evaluated by the
+        database when the data of the returned IdaGeoDataFrame is fetched.
+        Calling several binary methods in a row therefore doesn't wait for
+        any geospatial computation. Operations on the same pair of
+        IdaGeoDataFrames can be computed by a single query with binary_ops.
+
+        The database expands the view in the queries on the returned
+        IdaGeoDataFrame, so a projection such as
+        result[['INDEXERIDA1', 'RESULT']] doesn't evaluate the functions of
+        the other result columns. The columns of the view are known, hence
+        the returned IdaGeoDataFrame is built without checking the view or
+        fetching its columns.
         """
         ida1 = self
-        
-        # Check if allowed data type
-        if valid_types_ida1 and not ida1.geo_column_data_type in valid_types_ida1:
-            raise TypeError("Column " + ida1.geometry.column +
+
+        # The geometry property compares the state of the IdaGeoDataFrame
+        # with the one of its cached IdaGeoSeries, only the names of the
+        # columns are needed here
+        geometry_column1 = ida1._geometry_column_name()
+        geometry_column2 = ida2._geometry_column_name()
+
+        # Check if allowed data type. geo_column_data_type is set along with
+        # the geometry, reading it doesn't query the database
+        if valid_types_ida1 and ida1.geo_column_data_type not in valid_types_ida1:
+            raise TypeError("Column " + geometry_column1 +
                             " has incompatible type: ")
-        if valid_types_ida2 and not ida2.geo_column_data_type in valid_types_ida2:
-            raise TypeError("Column " + ida2.geometry.column +
+        if valid_types_ida2 and ida2.geo_column_data_type not in valid_types_ida2:
+            raise TypeError("Column " + geometry_column2 +
                             " has incompatible type.")
 
         # Get the definitions of the columns, which will be the arguments for
         # the function
-        column1 = 'IDA1.\"%s\"' %(ida1.geometry.column)
-        column2 = 'IDA2.\"%s\"' %(ida2.geometry.column)
-        arguments_for_function = [column1, column2]
-        if additional_args is not None:
-            for arg in additional_args:
-                arguments_for_function.append(arg)
+        column1 = 'IDA1.' + _quote_identifier(geometry_column1)
+        column2 = 'IDA2.' + _quote_identifier(geometry_column2)
+
+        # Geometries in different spatial reference systems can't be
+        # compared, fail before the database evaluates every pair of rows
+        srid1 = ida1._geometry_srid()
+        srid2 = ida2._geometry_srid()
+        if srid1 is not None and srid2 is not None and srid1 != srid2:
+            raise IdaGeoDataFrameError(
+                "The geometry columns " + geometry_column1 + " and " +
+                geometry_column2 + " have different spatial reference " +
+                "systems: " + str(srid1) + " and " + str(srid2) + ".")
+        if result_columns is None:
+            result_columns = OrderedDict(
+                [('RESULT', (function_name, additional_args, mbr_disjoint_result))])
 
         # SELECT statement
         select_columns=[]
-        if hasattr(ida1, '_indexer') and ida1._indexer is not None:
-            select_columns.append('IDA1.\"%s\" AS \"INDEXERIDA1\"' %(ida1.indexer))
-        else:
+        indexer1 = getattr(ida1, '_indexer', None)
+        if indexer1 is None:
             message = (ida1.tablename + "has no indexer defined. Please assign index column with set_indexer and retry.")
             raise IdaGeoDataFrameError(message)
-        if hasattr(ida2, '_indexer') and ida2._indexer is not None:
-            select_columns.append('IDA2.\"%s\" AS \"INDEXERIDA2\"' %(ida2.indexer))
-        else:
+        select_columns.append('IDA1.' + _quote_identifier(indexer1) + ' AS \"INDEXERIDA1\"')
+        indexer2 = getattr(ida2, '_indexer', None)
+        if indexer2 is None:
             message = (ida2.tablename + "has no indexer defined. Please assign index column with set_indexer and retry.")
             raise IdaGeoDataFrameError(message)
-        result_column = (
-            function_name+
-            '('+
-            ','.join(map(str, arguments_for_function))+
-            ')'
-        )
-        select_columns.append('%s AS \"RESULT\"' %(result_column))
+        select_columns.append('IDA2.' + _quote_identifier(indexer2) + ' AS \"INDEXERIDA2\"')
+        # The parts of the expressions which only depend on the pair of
+        # IdaGeoDataFrames are built once for all the result columns
+        geometry_arguments = column1 + ',' + column2
+        mbr_disjoint_test = (
+            'CASE WHEN inza..ST_MBRINTERSECTS(' + geometry_arguments + ') = 0')
+        # The first geometry is not the result of the function for empty
+        # geometries, e.g. ST_DIFFERENCE returns None
+        mbr_disjoint_nonempty_test = (
+            ' AND inza..ST_ISEMPTY(' + column1 + ') = 0' +
+            ' AND inza..ST_ISEMPTY(' + column2 + ') = 0')
+        for result_name, (function_name, additional_args, mbr_disjoint_result) in \
+                result_columns.items():
+            # The additional arguments are already SQL literals
+            if additional_args:
+                result_column = (function_name + '(' + geometry_arguments +
+                                 ',' + ','.join(additional_args) + ')')
+            else:
+                result_column = function_name + '(' + geometry_arguments + ')'
+            if mbr_disjoint_result is not None:
+                # Testing the bounding rectangles is much cheaper than the
+                # function, which is skipped when they don't intersect. A
+                # None result of the rectangle test falls back to the function
+                test = mbr_disjoint_test
+                if '{geometry1}' in mbr_disjoint_result:
+                    test += mbr_disjoint_nonempty_test
+                result_column = (
+                    test + ' THEN ' + mbr_disjoint_result.format(geometry1=column1) +
+                    ' ELSE ' + result_column + ' END'
+                )
+            select_columns.append(result_column + ' AS ' + _quote_identifier(result_name))
         select_statement = 'SELECT '+','.join(select_columns)+' '        
         
-        # FROM clause
+        # FROM clause. Only the indexer and the geometry of each side are
+        # selected, so that the other columns are not carried through the
+        # join of every pair of rows
         from_clause=(
             'FROM '+
-            '(SELECT * FROM ' + ida1.name + ') AS IDA1, '+
-            '(SELECT * FROM ' + ida2.name + ') AS IDA2 '
+            '(SELECT ' + _binary_operation_columns(indexer1, geometry_column1) +
+            ' FROM ' + ida1.name + ') AS IDA1, '+
+            '(SELECT ' + _binary_operation_columns(indexer2, geometry_column2) +
+            ' FROM ' + ida2.name + ') AS IDA2 '
         )
+        if intersecting_mbrs_only:
+            from_clause += 'WHERE inza..ST_MBRINTERSECTS(' + geometry_arguments + ') = 1 '
 
-        # Create a view
+        # Create a view, or reuse the one created by the same operation on
+        # the same data. The statement is a DDL whose variable parts are
+        # identifiers, which can't be bound as parameters of a prepared
+        # statement, so reusing the view is what saves the round-trip
         view_creation_query='('+select_statement+from_clause+')'
-        viewname=self._idadb._create_view_from_expression(view_creation_query)
-
-        idageodf=nzpyida.IdaGeoDataFrame(self._idadb, viewname, indexer='INDEXERIDA1')
+        binary_views = self._idadb.cache_geo_binary_views
+        viewname = binary_views.get(view_creation_query)
+        if viewname is None:
+            viewname = self._idadb._create_view_from_expression(view_creation_query)
+            binary_views[view_creation_query] = viewname
+
+        columns = Index(['INDEXERIDA1', 'INDEXERIDA2'] + list(result_columns))
+        idageodf = IdaGeoDataFrame._from_known_schema(
+            self._idadb, viewname, 'INDEXERIDA1', columns)
         return idageodf
\ No newline at end of file
@@ -12,18 +12,174 @@
 """
 IdaGeoSeries
 """
-from numbers import Number
+from numbers import Complex, Number, Real
+import math
+import struct
 from collections import OrderedDict
+from functools import wraps
 
-from lazy import lazy
+import numpy as np
+from pandas import DataFrame, Index
 import six
+from lazy import lazy
 
 import nzpyida
 from nzpyida.series import IdaSeries
 from nzpyida.exceptions import IdaGeoDataFrameError
+from nzpyida.sql import _prepare_query
 
 from nzpy.core import ProgrammingError
 
+# Linear units accepted by the geospatial functions, mapped to their quoted
+# form in Netezza syntax
+_LINEAR_UNITS = OrderedDict(
+    (unit, "'" + unit + "'")
+    for unit in ['meter', 'kilometer', 'foot', 'mile', 'nautical mile'])
+
+# Database types of columns which can't hold geometries, for which the
+# geometry type probe is not needed to reject the column
+_NON_GEOMETRY_DTYPES = frozenset([
+    'BYTEINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'REAL', 'DOUBLE',
+    'DOUBLE PRECISION', 'FLOAT', 'DECIMAL', 'NUMERIC', 'BOOLEAN', 'DATE',
+    'TIME', 'TIME WITH TIME ZONE', 'TIMESTAMP', 'INTERVAL'])
+
+# Concrete types of real numbers, e.g. distances
+_REAL_TYPES = (int, float, np.integer, np.floating)
+
+# Geometry types of collections, mapped to the type of their geometries
+_COLLECTION_PART_TYPES = OrderedDict([
+    ('ST_MULTIPOINT', 'ST_POINT'),
+    ('ST_MULTILINESTRING', 'ST_LINESTRING'),
+    ('ST_MULTIPOLYGON', 'ST_POLYGON')])
+
+# Digits from 0 to 9, combined to number the geometries of collections
+_DIGITS_QUERY = (
+    '(' + ' UNION ALL '.join('SELECT ' + str(digit) + ' AS D'
+                             for digit in range(10)) + ')')
+
+def _wkb_header(value):
+    """
+    Returns the byte order, the geometry type code without dimensions, e.g.
+    1 for a point, whether there are Z and M coordinates, and the offset of
+    the data, of a geometry in WKB. Both the ISO codes of the Z and M
+    dimensions, e.g. 1001 for a point Z, and the extended WKB flags are
+    accepted.
+    """
+    byte_order = '<' if value[0] == 1 else '>'
+    geometry_type = struct.unpack_from(byte_order + 'I', value, 1)[0]
+    offset = 5
+    if geometry_type & 0x20000000:
+        # Extended WKB with an SRID, which precedes the data
+        offset += 4
+    iso_dimensions = (geometry_type & 0x0FFFFFFF) // 1000
+    has_z = bool(geometry_type & 0x80000000) or iso_dimensions in (1, 3)
+    has_m = bool(geometry_type & 0x40000000) or iso_dimensions in (2, 3)
+    return (byte_order, (geometry_type & 0x0FFFFFFF) % 1000, has_z, has_m,
+            offset)
+
+def _wkb_point_coordinates(value):
+    """
+    Returns the X, Y, Z and M coordinates of a point in WKB, with NaN for
+    the coordinates it doesn't have, or for all of them if value is None.
+    """
+    coordinates = [np.nan] * 4
+    if value is None:
+        return coordinates
+    value = bytes(value)
+    byte_order, geometry_type, has_z, has_m, offset = _wkb_header(value)
+    if geometry_type != 1:
+        raise ValueError("The geometry is not a point")
+    values = struct.unpack_from(byte_order + 'd' * (2 + has_z + has_m),
+                                value, offset)
+    coordinates[0:2] = values[0:2]
+    if has_z:
+        coordinates[2] = values[2]
+    if has_m:
+        coordinates[3] = values[-1]
+    return coordinates
+
+def _fetch_values(idaseries):
+    """
+    Downloads the values of the column of an IdaSeries as a list, without
+    building a pandas object.
+    """
+    query = _prepare_query(idaseries.internal_state.get_state())
+    idaseries._idadb._check_connection()
+    cursor = idaseries._idadb._con.cursor()
+    try:
+        cursor.execute(query)
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+def _function_call(function_name, column_name, additional_args=None):
+    """
+    Returns the SQL call of a geospatial function on a column definition,
+    with the additional arguments, which are SQL literals, and the alias of
+    its result column, which is the call without double quotes.
+    """
+    if additional_args:
+        result_column = (function_name + '(' + column_name + ',' +
+                         ','.join(additional_args) + ')')
+    else:
+        result_column = function_name + '(' + column_name + ')'
+    return result_column, result_column.replace('"', '')
+
+def _geometry_type_cache_key(idadf, column):
+    """
+    Returns the key of the geometry type of a column in the
+    cache_geo_column_types cache of the parent IdaDataBase. The type is
+    probed on the first geometries only, so besides the table and the
+    definition of the column, the key includes the views selecting the rows,
+    but not the projections.
+    """
+    return (idadf._name, idadf.internal_state.columndict[column],
+            tuple(idadf.internal_state._views))
+
+# Names of the unary geospatial methods of IdaGeoSeries which can be called
+# without argument, filled by _unary_operation. The methods which are not
+# generated are declared here
+_UNARY_OPERATIONS = set(['boundary', 'convex_hull', 'geometry_type',
+                         'is_simple', 'mbr'])
+
+def _unary_operation(function_name, valid_types=None, return_geo_series=False,
+                     result_geometry_type=None, linear_unit=False):
+    """
+    Decorator generating a unary geospatial method of IdaGeoSeries without
+    arguments, which calls the database function function_name on the
+    geometries of the IdaGeoSeries. The decorated method only carries the
+    signature and the documentation, its body is never executed.
+    If linear_unit is True, the method returns an IdaSeries and takes an
+    optional unit argument, which is checked and passed to the function.
+    See IdaGeoSeries._unary_operation_handler for the other arguments.
+    """
+    if valid_types is not None:
+        valid_types = frozenset(valid_types)
+
+    # The class of the result is known when the method is defined, the
+    # method calls the handler of this class directly
+    if return_geo_series:
+        def operation(self):
+            return self._unary_geo_operation(
+                function_name, valid_types,
+                result_geometry_type=result_geometry_type)
+    elif linear_unit:
+        def operation(self, unit=None):
+            additional_args = None
+            if unit is not None:
+                # Can raise exceptions
+                additional_args = (self._check_linear_unit(unit),)
+            return self._unary_scalar_operation(
+                function_name, valid_types, additional_args)
+    else:
+        def operation(self):
+            return self._unary_scalar_operation(function_name, valid_types)
+
+    def decorator(method):
+        _UNARY_OPERATIONS.add(method.__name__)
+        return wraps(method)(operation)
+    return decorator
+
 class IdaGeoSeries(nzpyida.IdaSeries):
     """
     An IdaSeries whose column must have geometry type.
@@ -47,6 +203,21 @@ class IdaGeoSeries(nzpyida.IdaSeries):
     An IdaGeoSeries doesn't have an indexer attribute because geometries are
     unorderable in Netezza Performance Server Analytics.
 
+    The geospatial methods which return an IdaSeries or an IdaGeoSeries
+    don't compute anything when they are called: the column of the returned
+    series applies the function to the column of the calling series, and is
+    evaluated when the data is fetched. Chained methods and several columns
+    derived from the same geometry, e.g. centroid, area and perimeter
+    assigned to an IdaGeoDataFrame, are therefore computed by a single
+    SELECT, which the database evaluates in parallel over its data slices,
+    so calling the methods from several threads, which would share the
+    connection of the IdaDataBase, gains nothing. Such a method may only
+    query the geometry type of the calling series, to check its valid
+    types; the type is cached in the IdaDataBase by table, column
+    definition and row selection. The other methods, e.g. fetch_ops,
+    to_numpy, to_wkb_array, total_bounds and explode, query the database
+    when they are called.
+
     Examples
     --------
     >>> idageodf = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer='OBJECTID', geometry = "SHAPE")
@@ -77,17 +248,7 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         """
 
         super(IdaGeoSeries, self).__init__(idadb, tablename, indexer, column)
-        is_geometry_type = True
-        try:
-            self.column_data_type = self.geometry_type().head().iloc[0]
-        except ProgrammingError as e:
-            if "Geometry unsupported" in str(e):
-                is_geometry_type = False
-            else:
-                raise e    
-        if not is_geometry_type:
-            raise TypeError("Specified column doesn't have geometry type. " + 
-                            "Cannot create IdaGeoSeries object")
+        self._probe_column_data_type()
 
     @classmethod
     def from_IdaSeries(cls, idaseries):
@@ -95,27 +256,80 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         Creates an IdaGeoSeries from an IdaSeries, ensuring that the column
         of the given IdaSeries has geometry type.
         """
-        is_geometry_type = True
         if not isinstance(idaseries, IdaSeries):
             raise TypeError("Expected IdaSeries")
+        elif ('column_data_type' in idaseries.__dict__ and
+                type(idaseries) is IdaGeoSeries):
+            # Its column was already checked to have geometry type
+            return idaseries
         else:
             # Mind that the given IdaSeries might have non-destructive
             # columns that were added by the user. That's why __init__ is not
             # used for this purpose.
             idageoseries = idaseries
             idageoseries.__class__ = IdaGeoSeries
+            idageoseries._probe_column_data_type()
+            return idageoseries
+
+    @lazy
+    def column_data_type(self):
+        """
+        Geometry type of the column, e.g. ST_POLYGON, against which the
+        valid types of the geospatial methods are checked without querying
+        the database. It is resolved when the IdaGeoSeries is created, except
+        for the result of a geospatial method, whose column is known to have
+        geometry type: it is then only probed on first use, so that methods
+        which don't restrict their valid types can be chained without a
+        round-trip.
+        """
+        self._probe_column_data_type()
+        return self.__dict__['column_data_type']
+
+    def _probe_column_data_type(self):
+        """
+        Sets column_data_type to the geometry type of the first geometries
+        of the column. The result is cached in the parent IdaDataBase, so
+        IdaGeoSeries created on the same column and rows don't query the
+        database again.
+
+        Raises
+        ------
+        TypeError
+            If the column doesn't have geometry type.
+        """
+        geo_column_types = self._idadb.cache_geo_column_types
+        cache_key = _geometry_type_cache_key(self, self.column)
+        if cache_key not in geo_column_types:
+            # When the dtypes are already known, e.g. for a projection of an
+            # IdaGeoDataFrame, a column of a numeric or temporal type is
+            # rejected without a round-trip to the database
+            if self._known_column_dtype() in _NON_GEOMETRY_DTYPES:
+                raise TypeError("Specified column doesn't have geometry type. " +
+                                "Cannot create IdaGeoSeries object")
+            is_geometry_type = True
             try:
-                idageoseries.column_data_type = idageoseries.geometry_type().head().iloc[0]
+                geo_column_types[cache_key] = self.geometry_type().head().iloc[0]
             except ProgrammingError as e:
                 if "Geometry unsupported" in str(e) or \
                 'Unable to identify a function that satisfies the given argument types' in str(e):
                     is_geometry_type = False
                 else:
-                    raise e    
+                    raise e
             if not is_geometry_type:
-                raise TypeError("Specified column doesn't have geometry type. " + 
-                                    "Cannot create IdaGeoSeries object")
-            return idageoseries
+                raise TypeError("Specified column doesn't have geometry type. " +
+                                "Cannot create IdaGeoSeries object")
+        self.column_data_type = geo_column_types[cache_key]
+
+    def _known_column_dtype(self):
+        """
+        Returns the database type of the column if the dtypes of the
+        IdaGeoSeries are already known, None otherwise. Doesn't query the
+        database.
+        """
+        dtypes = self.__dict__.get('dtypes')
+        if dtypes is not None and self.column in dtypes.index:
+            return dtypes.loc[self.column, 'TYPENAME']
+        return None
 
 #==============================================================================
 ### Methods whose behavior is not defined for geometry types in NPS.
@@ -133,6 +347,19 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         raise TypeError("Unorderable geometries")
         pass
 
+    def head(self, nrow=5, sort=True):
+        """
+        Returns the first nrow geometries, see IdaDataFrame.head.
+
+        Geometries are unorderable, so if the IdaGeoSeries has no indexer,
+        the rows are not sorted, whatever the value of sort. The query is
+        then only limited to nrow rows, without first fetching the data
+        types of the column to look for a column to sort by.
+        """
+        if self.indexer is None:
+            sort = False
+        return super(IdaGeoSeries, self).head(nrow, sort=sort)
+
 #==============================================================================
 ### Unary geospatial methods
 #==============================================================================
@@ -164,6 +391,13 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         -------
         IdaGeoSeries.
 
+        Raises
+        ------
+        TypeError
+            If distance is not a real number.
+        ValueError
+            If distance is not finite.
+
         See also
         ---------
         linear_units
@@ -199,19 +433,37 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         4         <Geometry binary data>  <Geometry binary data>
         5         <Geometry binary data>  <Geometry binary data>
         """
-        if not isinstance(distance, Number):
+        # The concrete types are checked first, isinstance on the ABCs is
+        # slower. Other numbers, e.g. Decimal, which is not a Real, are
+        # accepted, except complex numbers
+        if isinstance(distance, bool) or not (
+                isinstance(distance, _REAL_TYPES) or isinstance(distance, Real)
+                or (isinstance(distance, Number) and
+                    not isinstance(distance, Complex))):
             # distance can be positive or negative
             raise TypeError("Distance must be numerical")
-        additional_args = []
-        additional_args.append(distance)
+        try:
+            is_finite = math.isfinite(distance)
+        except OverflowError:
+            # An int too large to be converted to a float
+            is_finite = False
+        if not is_finite:
+            raise ValueError("Distance must be finite")
+        # The literal is written the same way for equal distances, e.g. 20
+        # and 20.0, so that equal buffers generate the same SQL
+        additional_args = (repr(float(distance)),)
         if unit is not None:
             unit = self._check_linear_unit(unit)  # Can raise exceptions
-            additional_args.append(unit)
+            additional_args += (unit,)
         return self._unary_operation_handler(
             function_name = 'inza..ST_BUFFER',
             additional_args = additional_args,
             return_geo_series=True)
 
+    @_unary_operation(
+        'inza..ST_CENTROID',
+        return_geo_series=True,
+        result_geometry_type='ST_POINT')
     def centroid(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -249,9 +501,6 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         Fulton       <Geometry binary data>
         Clay         <Geometry binary data>
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_CENTROID',
-                return_geo_series=True)
 
     def convex_hull(self):
         """
@@ -351,6 +600,7 @@ class IdaGeoSeries(nzpyida.IdaSeries):
                 function_name = 'inza..ST_BOUNDARY',
                 return_geo_series=True)
 
+    @_unary_operation('inza..ST_ENVELOPE', return_geo_series=True)
     def envelope(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -393,10 +643,12 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         4          <Geometry binary data>   <Geometry binary data>
         5          <Geometry binary data>   <Geometry binary data>
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_ENVELOPE',
-                return_geo_series=True)
 
+    @_unary_operation(
+        'inza..ST_EXTERIORRING',
+        valid_types=['ST_POLYGON'],
+        return_geo_series=True,
+        result_geometry_type='ST_LINESTRING')
     def exterior_ring(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -431,10 +683,6 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         1   1102    <Geometry binary data>  <Geometry binary data>
 
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_EXTERIORRING',
-                valid_types = ['ST_POLYGON'],
-                return_geo_series=True)
 
     def mbr(self):
         """
@@ -477,6 +725,11 @@ class IdaGeoSeries(nzpyida.IdaSeries):
                 function_name = 'inza..ST_MBR',
                 return_geo_series=True)
 
+    @_unary_operation(
+        'inza..ST_ENDPOINT',
+        valid_types=['ST_LINESTRING'],
+        return_geo_series=True,
+        result_geometry_type='ST_POINT')
     def end_point(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -512,11 +765,12 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         1 	1111 	<Geometry binary data> 	<Geometry binary data>      
         
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_ENDPOINT',
-                valid_types = ['ST_LINESTRING'],
-                return_geo_series=True)
 
+    @_unary_operation(
+        'inza..ST_STARTPOINT',
+        valid_types=['ST_LINESTRING'],
+        return_geo_series=True,
+        result_geometry_type='ST_POINT')
     def start_point(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -549,11 +803,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         1    <Geometry binary data>
                
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_STARTPOINT',
-                valid_types = ['ST_LINESTRING'],
-                return_geo_series=True)
 
+    @_unary_operation('inza..ST_SRID')
     def srid(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -582,8 +833,6 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3    1005
         4    1005       
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_SRID')
 
     def geometry_type(self):
         """
@@ -629,6 +878,331 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         return self._unary_operation_handler(
                 function_name = 'inza..ST_GEOMETRYTYPE')
 
+    @_unary_operation('inza..ST_ASBINARY')
+    def as_binary(self):
+        """
+        Valid types for the column in the calling IdaGeoSeries:
+        ST_Geometry or one of its subtypes.
+
+        Returns an IdaSeries with the well-known binary (WKB) representation
+        of each of the geometries in the calling IdaGeoSeries. The conversion
+        is done in the database, so that geometries downloaded with head()
+        or as_dataframe() can be read directly by WKB libraries such as
+        shapely, and are more compact than their well-known text.
+
+        For None geometries the output is None.
+
+        Returns
+        -------
+        IdaSeries.
+
+        References
+        ----------
+        Netezza Performance Server Analytics ST_AsBinary() function.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer = 'OBJECTID', geometry = 'SHAPE')
+        >>> wkb = counties.as_binary().as_dataframe()
+        """
+
+    def fetch_ops(self, operations):
+        """
+        Computes several unary geospatial operations on the geometries of
+        the IdaGeoSeries and downloads their results with a single query,
+        instead of one query per operation.
+
+        Parameters
+        ----------
+        operations : list of str
+            Names of the geospatial methods of IdaGeoSeries to compute,
+            among those which can be called without argument, e.g.
+            ['max_x', 'max_y', 'max_z', 'max_m']. Methods with a unit are
+            computed without a unit argument.
+
+        Returns
+        -------
+        DataFrame with one column per operation, named after it, preceded by
+        the indexer of the IdaGeoSeries if it has one.
+
+        Raises
+        ------
+        ValueError
+            If an operation is not a unary geospatial method.
+        TypeError
+            If an operation doesn't accept the type of the column.
+
+        See also
+        --------
+        IdaGeoDataFrame.unary_ops
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer = 'OBJECTID', geometry = 'SHAPE')
+        >>> counties.geometry.fetch_ops(['min_x', 'max_x']).head(2)
+           OBJECTID      min_x      max_x
+        0         1 -92.141130 -91.520920
+        1         2 -83.131870 -82.413040
+        """
+        if isinstance(operations, six.string_types):
+            operations = [operations]
+        if not operations:
+            raise ValueError("operations must contain at least one operation")
+        for operation in operations:
+            if operation not in _UNARY_OPERATIONS:
+                raise ValueError("'" + str(operation) + "' is not a unary "
+                    "geospatial operation, valid operations are: " +
+                    ", ".join(sorted(_UNARY_OPERATIONS)))
+
+        # The results are selected side by side from the rows of the
+        # IdaGeoSeries, in the same way as the column of each result
+        columndict = OrderedDict()
+        if self.indexer is not None:
+            columndict[self.indexer] = '"' + self.indexer + '"'
+        for operation in operations:
+            result = getattr(self, operation)()
+            columndict[operation] = result.internal_state.columndict[result.column]
+        idaseries = self._clone()
+        idaseries.internal_state.columns = ['"' + column + '"' for column in columndict]
+        idaseries.internal_state.columndict = columndict
+        idaseries.internal_state.update()
+        query = _prepare_query(idaseries.internal_state.get_state())
+
+        self._idadb._check_connection()
+        cursor = self._idadb._con.cursor()
+        try:
+            cursor.execute(query)
+            return DataFrame.from_records(cursor.fetchall(),
+                                          columns=list(columndict))
+        finally:
+            cursor.close()
+
+    def to_numpy(self, operation):
+        """
+        Computes a unary geospatial operation on the geometries of the
+        IdaGeoSeries and downloads its results directly into a NumPy array,
+        without building a pandas Series.
+
+        Parameters
+        ----------
+        operation : str
+            Name of a geospatial method of IdaGeoSeries which can be called
+            without argument, e.g. 'max_x'.
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer or float64 array for numeric results. If some results
+            are None, the array has type float64 and NaN for them.
+
+        Raises
+        ------
+        ValueError
+            If operation is not a unary geospatial method.
+        TypeError
+            If the operation doesn't accept the type of the column.
+
+        Notes
+        -----
+        The rows are in the order returned by the database. Use fetch_ops
+        to download the indexer along with the results.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer = 'OBJECTID', geometry = 'SHAPE')
+        >>> counties.geometry.to_numpy('max_x').max()
+        -67.00742
+        """
+        if operation not in _UNARY_OPERATIONS:
+            raise ValueError("'" + str(operation) + "' is not a unary "
+                "geospatial operation, valid operations are: " +
+                ", ".join(sorted(_UNARY_OPERATIONS)))
+        array = np.array(_fetch_values(getattr(self, operation)()))
+        if array.dtype == object:
+            try:
+                return array.astype(np.float64)
+            except (TypeError, ValueError):
+                pass
+        return array
+
+    def total_bounds(self):
+        """
+        Valid types for the column in the calling IdaGeoSeries:
+        ST_Geometry or one of its subtypes.
+
+        Returns the bounds of all the geometries of the IdaGeoSeries: the
+        minimum of min_x and min_y and the maximum of max_x and max_y. They
+        are reduced in the database by a single query, which returns one
+        row, instead of downloading the bounds of every geometry.
+
+        Returns
+        -------
+        numpy.ndarray
+            float64 array [min_x, min_y, max_x, max_y], with NaN if there
+            is no geometry which is not None.
+
+        See also
+        --------
+        IdaGeoDataFrame.bounds
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer = 'OBJECTID', geometry = 'SHAPE')
+        >>> counties.geometry.total_bounds()
+        array([-178.21529,   18.92478,  -66.96927,   71.40667])
+        """
+        columndict = OrderedDict()
+        for aggregate, operation in (('MIN', 'min_x'), ('MIN', 'min_y'),
+                                     ('MAX', 'max_x'), ('MAX', 'max_y')):
+            result = getattr(self, operation)()
+            columndict[operation.upper()] = (
+                aggregate + '(' + result.internal_state.columndict[result.column] + ')')
+        idaseries = self._clone()
+        idaseries.internal_state.columns = ['"' + column + '"' for column in columndict]
+        idaseries.internal_state.columndict = columndict
+        idaseries.internal_state.update()
+        query = _prepare_query(idaseries.internal_state.get_state())
+
+        self._idadb._check_connection()
+        cursor = self._idadb._con.cursor()
+        try:
+            cursor.execute(query)
+            return np.array(cursor.fetchone(), dtype=np.float64)
+        finally:
+            cursor.close()
+
+    def point_coordinates(self):
+        """
+        Valid types for the column in the calling IdaGeoSeries:
+        ST_POINT.
+
+        Returns the X, Y, Z and M coordinates of the points of the
+        IdaGeoSeries, decoded on the client from the WKB downloaded by
+        to_wkb_array. The WKB is downloaded once per IdaGeoSeries, so that
+        further calls don't query the database, unlike x(), y(), z() and m().
+
+        Returns
+        -------
+        numpy.ndarray of float64, with one row per point and the columns X,
+        Y, Z and M. The coordinates a point doesn't have, and those of None
+        and empty points, are NaN.
+
+        Raises
+        ------
+        TypeError
+            If the column has incompatible type.
+
+        Examples
+        --------
+        >>> sample_points = IdaGeoDataFrame(idadb, 'SAMPLE_POINTS', indexer='ID', geometry='LOC')
+        >>> sample_points.geometry.point_coordinates()
+        array([[ 14.,  58.,  nan,  nan],
+               [ 12.,  35.,  nan,  nan],
+               [ 12.,  66.,  nan,  nan]])
+        """
+        if self.column_data_type != 'ST_POINT':
+            raise TypeError("Column " + self.column +
+                            " has incompatible type.")
+        coordinates = np.empty((len(self._wkb_values), 4), dtype=np.float64)
+        for row, value in enumerate(self._wkb_values):
+            coordinates[row] = _wkb_point_coordinates(value)
+        return coordinates
+
+    def wkb_coord_dim(self):
+        """
+        Valid types for the column in the calling IdaGeoSeries:
+        ST_Geometry or one of its subtypes.
+
+        Returns the coordinate dimensions of the geometries, like
+        coord_dim(), decoded on the client from the header of the WKB
+        downloaded by to_wkb_array: 2 plus 1 if the geometry has Z
+        coordinates plus 1 if it has M coordinates. The WKB is downloaded
+        once per IdaGeoSeries, so that further calls, or calls of
+        point_coordinates, don't query the database.
+
+        Returns
+        -------
+        numpy.ndarray of float64, with NaN for None geometries.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer = 'OBJECTID', geometry = 'SHAPE')
+        >>> counties.geometry.wkb_coord_dim()[:3]
+        array([2., 2., 2.])
+        """
+        dimensions = np.full(len(self._wkb_values), np.nan)
+        for row, value in enumerate(self._wkb_values):
+            if value is not None:
+                _, _, has_z, has_m, _ = _wkb_header(bytes(value))
+                dimensions[row] = 2 + has_z + has_m
+        return dimensions
+
+    def to_wkb_array(self, arrow=False, refresh=False):
+        """
+        Downloads the geometries of the IdaGeoSeries as well-known binary
+        (WKB) into a single array, which libraries such as shapely or
+        GeoPandas read at once, without building a DataFrame of the rows.
+
+        Parameters
+        ----------
+        arrow : bool, default: False
+            If True, returns a pyarrow BinaryArray, whose WKB values are
+            stored in one contiguous buffer, as in the GeoArrow WKB
+            encoding.
+        refresh : bool, default: False
+            If True, downloads the WKB values again instead of returning
+            those kept on the client, e.g. after the table was modified by
+            another connection.
+
+        Returns
+        -------
+        numpy.ndarray of bytes, or pyarrow.BinaryArray if arrow is True.
+        None geometries are None.
+
+        Raises
+        ------
+        ImportError
+            If arrow is True and pyarrow is not installed.
+
+        Notes
+        -----
+        pyarrow is an optional dependency, only needed if arrow is True.
+
+        The WKB values are downloaded once per IdaGeoSeries and kept on the
+        client, so that further calls, for example to compute planar
+        measures locally with shapely during an exploration, do not query
+        the database again. They are downloaded again after the table was
+        modified through the IdaDataBase of the IdaGeoSeries, or if refresh
+        is True. point_coordinates and wkb_coord_dim use the same values.
+
+        Examples
+        --------
+        >>> counties = IdaGeoDataFrame(idadb, 'SAMPLES.GEO_COUNTY', indexer = 'OBJECTID', geometry = 'SHAPE')
+        >>> wkb = counties.geometry.to_wkb_array()
+        >>> shapes = shapely.from_wkb(wkb)
+        """
+        if arrow:
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError("pyarrow is needed to return a BinaryArray, "
+                                  "install it or set arrow to False")
+
+        if refresh:
+            self._reset_attributes("_wkb_values")
+        values = self._wkb_values
+        if arrow:
+            return pyarrow.array(values, type=pyarrow.binary())
+        return np.array(values, dtype=object)
+
+    @lazy
+    def _wkb_values(self):
+        """
+        List of the WKB values of the geometries, downloaded at first use.
+        """
+        return _fetch_values(self.as_binary())
+
+    @_unary_operation('inza..ST_AREA', linear_unit=True)
     def area(self, unit = None):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -696,14 +1270,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         Fulton       1382.620091
         Clay         2725.095566
         """
-        additional_args = []
-        if unit is not None:
-            unit = self._check_linear_unit(unit)  # Can raise exceptions
-            additional_args.append(unit)
-        return self._unary_operation_handler(
-            function_name = 'inza..ST_AREA',
-            additional_args = additional_args)
 
+    @_unary_operation('inza..ST_DIMENSION')
     def dimension(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -751,9 +1319,11 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   <Geometry binary data>  0
         4   <Geometry binary data>  0
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_DIMENSION')
 
+    @_unary_operation(
+        'inza..ST_LENGTH',
+        valid_types=['ST_LINESTRING', 'ST_MULTILINESTRING'],
+        linear_unit=True)
     def length(self, unit = None):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -817,15 +1387,11 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         4           <Geometry binary data>  0.014173
         5           <Geometry binary data>  4.254681
         """
-        additional_args = []
-        if unit is not None:
-            unit = self._check_linear_unit(unit)  # Can raise exceptions
-            additional_args.append(unit)
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_LENGTH',
-                valid_types = ['ST_LINESTRING', 'ST_MULTILINESTRING'],
-                additional_args = additional_args)
 
+    @_unary_operation(
+        'inza..ST_PERIMETER',
+        valid_types=['ST_POLYGON', 'ST_MULTIPOLYGON'],
+        linear_unit=True)
     def perimeter(self, unit = None):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -888,15 +1454,10 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   Cleveland   <Geometry binary data>  1.662438
         4   McIntosh    <Geometry binary data>  2.122012       
         """
-        additional_args = []
-        if unit is not None:
-            unit = self._check_linear_unit(unit)  # Can raise exceptions
-            additional_args.append(unit)
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_PERIMETER',
-                valid_types = ['ST_POLYGON', 'ST_MULTIPOLYGON'],
-                additional_args = additional_args)
 
+    @_unary_operation(
+        'inza..ST_NUMGEOMETRIES',
+        valid_types=['ST_MULTIPOINT', 'ST_MULTIPOLYGON', 'ST_MULTILINESTRING'])
     def num_geometries(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -939,11 +1500,120 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         >>> sample_mlines.num_geometries().head()
         0    3       
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_NUMGEOMETRIES',
-                valid_types = ['ST_MULTIPOINT', 'ST_MULTIPOLYGON',
-                               'ST_MULTILINESTRING'])
 
+    def explode(self):
+        """
+        Valid types for the column in the calling IdaGeoSeries:
+        ST_MULTIPOINT, ST_MULTIPOLYGON, ST_MULTILINESTRING.
+
+        Returns an IdaGeoDataFrame with a row for each geometry of each of the
+        collections in the calling IdaGeoSeries. ST_NUMGEOMETRIES() and
+        ST_GEOMETRYN() are computed by the same SELECT, so that each
+        collection is read once.
+
+        For None collections and empty collections there is no row.
+
+        Returns
+        -------
+        IdaGeoDataFrame with three columns:
+
+        indexer of the calling IdaGeoSeries,
+        GEOMETRY_INDEX : position of the geometry in its collection, from 1,
+        column of the calling IdaGeoSeries : the geometry, set as geometry
+        column, of type ST_POINT, ST_LINESTRING or ST_POLYGON.
+
+        Raises
+        ------
+        TypeError
+            If the column has incompatible type.
+        IdaGeoDataFrameError
+            If the IdaGeoSeries has no indexer.
+
+        Notes
+        -----
+        The result is a view, which the positions of the geometries are joined
+        with. Their number is fixed when the view is created: it is the
+        smallest power of 10 above the largest collection, so that
+        geometries added to larger collections afterwards are left out.
+
+        References
+        ----------
+        Netezza Performance Server Analytics ST_NUMGEOMETRIES() and
+        ST_GEOMETRYN() functions.
+
+        Examples
+        --------
+        >>> sample_mlines = IdaGeoDataFrame(idadb, "SAMPLE_MLINES", indexer = "ID", geometry = "GEOMETRY")
+        >>> lines = sample_mlines.geometry.explode()
+        >>> lines.head()
+           ID  GEOMETRY_INDEX  GEOMETRY
+        0   1               1  <Geometry binary data>
+        1   1               2  <Geometry binary data>
+        2   1               3  <Geometry binary data>
+        """
+        # Imported here because geo_frame depends on this module
+        from nzpyida.geo_frame import IdaGeoDataFrame, _quote_identifier
+
+        if self.column_data_type not in _COLLECTION_PART_TYPES:
+            raise TypeError("Column " + self.column +
+                            " has incompatible type.")
+        if self.indexer is None:
+            raise IdaGeoDataFrameError(
+                self.tablename + " has no indexer defined. Please assign " +
+                "index column with set_indexer and retry.")
+
+        # The collections are selected with the indexer from the state of
+        # the IdaGeoSeries, in the same way as the columns of fetch_ops, so
+        # that filtered, derived or renamed columns are read as they are
+        column_name = self.internal_state.columndict[self.column]
+        columndict = OrderedDict()
+        columndict['INDEXER'] = '"' + self.indexer + '"'
+        columndict['GEOMETRY'] = column_name
+        columndict['NUM_GEOMETRIES'] = 'inza..ST_NUMGEOMETRIES(' + column_name + ')'
+        collections = self._clone()
+        collections.internal_state.columns = ['"' + column + '"' for column in columndict]
+        collections.internal_state.columndict = columndict
+        collections.internal_state.update()
+        collections_query = '(' + collections.internal_state.get_state() + ') AS IDA'
+        max_num_geometries = self._idadb.ida_scalar_query(
+            'SELECT MAX(IDA."NUM_GEOMETRIES") FROM ' + collections_query)
+
+        # Positions from 1 to the smallest power of 10 above the largest
+        # collection, as sums of digits
+        num_digits = len(str(int(max_num_geometries or 0)))
+        position = ' + '.join(
+            ['D' + str(i) + '.D * ' + str(10 ** i) for i in range(num_digits)] +
+            ['1'])
+        positions_query = (
+            '(SELECT ' + position + ' AS N FROM ' +
+            ', '.join(_DIGITS_QUERY + ' AS D' + str(i)
+                      for i in range(num_digits)) +
+            ')')
+
+        view_creation_query = (
+            '(SELECT IDA."INDEXER" AS ' + _quote_identifier(self.indexer) +
+            ', PARTS.N AS "GEOMETRY_INDEX", ' +
+            'inza..ST_GEOMETRYN(IDA."GEOMETRY", PARTS.N) AS ' +
+            _quote_identifier(self.column) + ' ' +
+            'FROM ' + collections_query + ', ' + positions_query + ' AS PARTS ' +
+            'WHERE PARTS.N <= IDA."NUM_GEOMETRIES")')
+        binary_views = self._idadb.cache_geo_binary_views
+        viewname = binary_views.get(view_creation_query)
+        if viewname is None:
+            viewname = self._idadb._create_view_from_expression(view_creation_query)
+            binary_views[view_creation_query] = viewname
+
+        columns = Index([self.indexer, 'GEOMETRY_INDEX', self.column])
+        idageodf = IdaGeoDataFrame._from_known_schema(
+            self._idadb, viewname, self.indexer, columns)
+        # The type of the geometries is known, it is not probed
+        cache_key = _geometry_type_cache_key(idageodf, self.column)
+        self._idadb.cache_geo_column_types[cache_key] = \
+            _COLLECTION_PART_TYPES[self.column_data_type]
+        idageodf.set_geometry(self.column)
+        return idageodf
+
+    @_unary_operation('inza..ST_NUMINTERIORRING', valid_types=['ST_POLYGON'])
     def num_interior_ring(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -974,10 +1644,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         0   <Geometry binary data>  0
         1   <Geometry binary data>  1        
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_NUMINTERIORRING',
-                valid_types = ['ST_POLYGON'])
 
+    @_unary_operation('inza..ST_NUMPOINTS')
     def num_points(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1011,9 +1679,41 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   <Geometry binary data> 	NaN
         4   <Geometry binary data> 	3.0
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_NUMPOINTS')
 
+    def polygon_shape_stats(self):
+        """
+        Valid types for the column in the calling IdaGeoSeries:
+        ST_POLYGON.
+
+        Returns the number of points and the number of interior rings of
+        each of the polygons in the calling IdaGeoSeries, which are computed
+        by the same SELECT, so that the rows of the table are scanned once.
+
+        Returns
+        -------
+        DataFrame with the columns num_points and num_interior_ring,
+        preceded by the indexer of the IdaGeoSeries if it has one.
+
+        Raises
+        ------
+        TypeError
+            If the column doesn't have type ST_POLYGON.
+
+        See also
+        --------
+        fetch_ops
+
+        Examples
+        --------
+        >>> sample_polygons = IdaGeoDataFrame(idadb, "SAMPLE_POLYGONS", indexer = "ID", geometry = "GEOMETRY")
+        >>> sample_polygons.geometry.polygon_shape_stats().head(2)
+           ID  num_points  num_interior_ring
+        0   1           5                  0
+        1   2          10                  1
+        """
+        return self.fetch_ops(['num_points', 'num_interior_ring'])
+
+    @_unary_operation('inza..ST_COORDDIM')
     def coord_dim(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1058,9 +1758,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3 	4 	<Geometry binary data> 	2
         4 	5 	<Geometry binary data>  3
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_COORDDIM')
 
+    @_unary_operation('inza..ST_IS3D')
     def is_3d(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1094,9 +1793,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3 	<Geometry binary data>	False
         4 	<Geometry binary data> 	True        
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_IS3D')
 
+    @_unary_operation('inza..ST_ISMEASURED')
     def is_measured(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1131,9 +1829,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         4 	5 	<Geometry binary data> 	3 	        True    False
 
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_ISMEASURED')
 
+    @_unary_operation('inza..ST_MAXM')
     def max_m(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1171,9 +1868,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   4   <Geometry binary data> 	NaN 	NaN 	None 	None
         4   5   <Geometry binary data> 	35.0 	6.0 	None 	None
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MAXM')
 
+    @_unary_operation('inza..ST_MAXX')
     def max_x(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1210,9 +1906,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   4   <Geometry binary data> 	NaN 	NaN 	None 	None
         4   5   <Geometry binary data> 	35.0 	6.0 	None 	None
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MAXX')
 
+    @_unary_operation('inza..ST_MAXY')
     def max_y(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1249,9 +1944,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   4   <Geometry binary data> 	NaN 	NaN 	None 	None
         4   5   <Geometry binary data> 	35.0 	6.0 	None 	None
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MAXY')
 
+    @_unary_operation('inza..ST_MAXZ')
     def max_z(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1289,9 +1983,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   4   <Geometry binary data> 	NaN 	NaN 	None 	None
         4   5   <Geometry binary data> 	35.0 	6.0 	None 	None
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MAXZ')
 
+    @_unary_operation('inza..ST_MINM')
     def min_m(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1330,9 +2023,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   4   <Geometry binary data> 	NaN 	NaN 	None 	None
         4   5   <Geometry binary data> 	33.0 	2.0 	None 	None
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MINM')
 
+    @_unary_operation('inza..ST_MINX')
     def min_x(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1363,9 +2055,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3    -83.794279
         4    -79.856688
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MINX')
 
+    @_unary_operation('inza..ST_MINY')
     def min_y(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1396,9 +2087,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3    35.562878
         4    37.005883
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MINY')
 
+    @_unary_operation('inza..ST_MINZ')
     def min_z(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1437,9 +2127,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3   4   <Geometry binary data> 	NaN 	NaN 	None 	None
         4   5   <Geometry binary data> 	33.0 	2.0 	None 	None
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_MINZ')
 
+    @_unary_operation('inza..ST_M', valid_types=['ST_POINT'])
     def m(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1472,10 +2161,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
          	ID 	LOC 	                X 	    Y 	    M
         0 	3 	<Geometry binary data> 	12.0 	66.0 	43.0
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_M',
-                valid_types = ['ST_POINT'])
 
+    @_unary_operation('inza..ST_X', valid_types=['ST_POINT'])
     def x(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1512,10 +2199,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         4 	5 	<Geometry binary data> 	12.0 	35.0
 
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_X',
-                valid_types = ['ST_POINT'])
 
+    @_unary_operation('inza..ST_Y', valid_types=['ST_POINT'])
     def y(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1551,10 +2236,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         3 	4 	<Geometry binary data> 	14.0 	58.0
         4 	5 	<Geometry binary data> 	12.0 	35.0
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_Y',
-                valid_types = ['ST_POINT'])
 
+    @_unary_operation('inza..ST_Z', valid_types=['ST_POINT'])
     def z(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1589,10 +2272,10 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         1   6   <Geometry binary data>  17.0    65.0    32.0
 
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_Z',
-                valid_types = ['ST_POINT'])
 
+    @_unary_operation(
+        'inza..ST_ISCLOSED',
+        valid_types=['ST_LINESTRING', 'ST_MULTILINESTRING'])
     def is_closed(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1627,10 +2310,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         0    False
         1    False
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_ISCLOSED',
-                valid_types = ['ST_LINESTRING', 'ST_MULTILINESTRING'])
 
+    @_unary_operation('inza..ST_ISEMPTY')
     def is_empty(self):
         """
         Valid types for the column in the calling IdaGeoSeries:
@@ -1659,8 +2340,6 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         1    0
         2    0     
         """
-        return self._unary_operation_handler(
-                function_name = 'inza..ST_ISEMPTY')
 
     def is_simple(self):
         """
@@ -1711,7 +2390,8 @@ class IdaGeoSeries(nzpyida.IdaSeries):
 ### Private utilities for geospatial methods
 #==============================================================================
 
-    def _check_linear_unit(self, unit):
+    @staticmethod
+    def _check_linear_unit(unit):
         """
         Parameters:
         -----------
@@ -1721,35 +2401,34 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         Returns
         -------
         str
-            The name of the unit in uppercase and formatted for netezza syntax.
+            The name of the unit in lowercase and formatted for netezza syntax.
 
         Raises
         ------
         TypeError
             * If the unit is not a string
             * If the unit is a string larger than 128 characters
+        IdaGeoDataFrameError
+            If the unit is not a linear unit.
         """
-        available_units = ['meter', 'kilometer', 'foot', 'mile', 'nautical mile']
         if not isinstance(unit, six.string_types):
             raise TypeError("unit must be a string")
+        # Valid units are found by a single lookup, the length of the unit
+        # only matters for the error raised for an invalid one
+        quoted_unit = _LINEAR_UNITS.get(unit.lower())
+        if quoted_unit is not None:
+            return quoted_unit
         elif len(unit) > 128:
             raise TypeError("unit length exceeded")
         else:
-            unit = unit.lower()
-            if unit not in available_units:
-                raise IdaGeoDataFrameError(
-                    f"Invalid unit,  must be one of: {available_units}")
-            if "\'" in unit:
-                unit = unit.replace("'", "''")
-
-            # Enclose in single quotation marks
-            unit = '\''+unit+'\''
-            return unit
+            raise IdaGeoDataFrameError(
+                f"Invalid unit,  must be one of: {list(_LINEAR_UNITS)}")
 
     def _unary_operation_handler(self, function_name,
                                  valid_types = None,
                                  additional_args = None,
-                                 return_geo_series=False):
+                                 return_geo_series=False,
+                                 result_geometry_type=None):
         """
         Returns the resulting column of an unary geospatial method as an
         IdaGeoSeries if it has geometry type, as an IdaSeries otherwise.
@@ -1758,12 +2437,19 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         ----------
         function_name : str
             Name of the corresponding function.
-        valid_types : list of str
-            Valid input typenames.
-        additional_args : list of str, optional
-            Additional arguments for the function.
+        valid_types : collection of str
+            Valid input typenames. They are compared with the column_data_type
+            resolved when the IdaGeoSeries was created, without querying the
+            database.
+        additional_args : list or tuple of str, optional
+            Additional arguments for the function, as SQL literals.
         return_geo_series : bool, optional
             Flag whether expected output series contains spatial data
+        result_geometry_type : str, optional
+            Geometry type of the output series, when the function always
+            returns this type. The geometry type of the output series is
+            then not probed in the database, which lets geospatial methods
+            be chained without a round-trip.
 
         Returns
         -------
@@ -1772,6 +2458,34 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         IdaSeries
             If the return_geo_series argument is False.
         """
+        if return_geo_series:
+            return self._unary_geo_operation(
+                function_name, valid_types, additional_args,
+                result_geometry_type)
+        return self._unary_scalar_operation(
+            function_name, valid_types, additional_args)
+
+    def _unary_geo_operation(self, function_name, valid_types=None,
+                             additional_args=None, result_geometry_type=None):
+        """
+        Returns the resulting column of an unary geospatial method which has
+        geometry type, as an IdaGeoSeries. See _unary_operation_handler.
+        """
+        idaseries = self._unary_scalar_operation(
+            function_name, valid_types, additional_args)
+        # The result of a geospatial function has geometry type, so that
+        # it doesn't need to be checked by from_IdaSeries
+        idaseries.__class__ = IdaGeoSeries
+        if result_geometry_type is not None:
+            idaseries.column_data_type = result_geometry_type
+        return idaseries
+
+    def _unary_scalar_operation(self, function_name, valid_types=None,
+                                additional_args=None):
+        """
+        Returns the resulting column of an unary geospatial method, as an
+        IdaSeries. See _unary_operation_handler.
+        """
         if valid_types and not (self.column_data_type in valid_types):
             raise TypeError("Column " + self.column +
                             " has incompatible type.")
@@ -1786,27 +2500,18 @@ class IdaGeoSeries(nzpyida.IdaSeries):
         # in the Ida object.
         column_name = self.internal_state.columndict[self.column]
 
-        arguments_for_function = [column_name]
-
-        if additional_args is not None:
-            for arg in additional_args:
-                arguments_for_function.append(arg)
-
-        result_column = (
-            function_name +
-            '(' +
-            ','.join(map(str, arguments_for_function)) +
-            ')'
-            )
-
-        new_columndict = OrderedDict()
+        # The additional arguments are already SQL literals.
         # result_column_key must not include double quotes because it is used as as Python key and as
         # an SQL alias for the result column expression like in
         # SELECT inza..ST_AREA("SHAPE",'KILOMETER') AS "inza..ST_AREA(SHAPE,'KILOMETER')" FROM SAMPLES.GEO_COUNTY
-        result_column_key = result_column.replace('"', '')
-        new_columndict[result_column_key] = result_column
+        result_column, result_column_key = _function_call(
+            function_name, column_name, additional_args)
 
-        idaseries._reset_attributes(["get_columns", "shape", "dtypes"])
+        # A single column, whose order doesn't need an OrderedDict
+        new_columndict = {result_column_key: result_column}
+
+        # The clone is new, none of its lazy attributes, e.g. columns, shape
+        # or dtypes, has been evaluated yet, so none needs to be reset
         idaseries.internal_state.columns = ['\"' + result_column_key + '\"']
 
         idaseries.internal_state.columndict = new_columndict
@@ -1814,13 +2519,5 @@ class IdaGeoSeries(nzpyida.IdaSeries):
 
         # Set the column attribute of the new idaseries
         idaseries._column = result_column_key
-        
-        try:
-            del(idaseries.columns)
-        except:
-            pass
-        
-        if return_geo_series:
-            return IdaGeoSeries.from_IdaSeries(idaseries)
-        else:
-            return idaseries
+
+        return idaseries
@@ -12,8 +12,13 @@
 IdaDataFrameGroupBy
 """
 import pandas as pd
+import six
 import nzpyida
 
+# SQL aggregate function of each aggregation method
+_AGGREGATION_METHODS = {'count': 'COUNT', 'sum': 'SUM', 'min': 'MIN',
+                        'max': 'MAX', 'mean': 'AVG'}
+
 class IdaDataFrameGroupBy(object):
     """
     Class representing groupby object, that is object created from IdaDataFrame.
@@ -75,8 +80,7 @@ class IdaDataFrameGroupBy(object):
         IdaDataFrame
             Object with grouped data
         """     
-        self.aggregation_method = "COUNT"
-        return self._execute_query()
+        return self.agg("count")
     
     def sum(self):
         """
@@ -88,8 +92,7 @@ class IdaDataFrameGroupBy(object):
         IdaDataFrame
             Object with grouped data
         """   
-        self.aggregation_method = "SUM"
-        return self._execute_query()
+        return self.agg("sum")
 
     def min(self):
         """
@@ -101,8 +104,7 @@ class IdaDataFrameGroupBy(object):
         IdaDataFrame
             Object with grouped data
         """   
-        self.aggregation_method = "MIN"
-        return self._execute_query()
+        return self.agg("min")
     
     def max(self):
         """
@@ -114,8 +116,7 @@ class IdaDataFrameGroupBy(object):
         IdaDataFrame
             Object with grouped data
         """   
-        self.aggregation_method = "MAX"
-        return self._execute_query()
+        return self.agg("max")
     
     def mean(self):
         """
@@ -127,18 +128,61 @@ class IdaDataFrameGroupBy(object):
         IdaDataFrame
             Object with grouped data
         """   
-        self.aggregation_method = "AVG"
-        return self._execute_query()
-    
-    def _execute_query(self):
-        select_string = f'{self.aggregation_method}(' + \
-            f'), {self.aggregation_method}('.join(self.columns_to_aggregate) + \
-                ')'
-        for col in self.columns_to_aggregate:
-            select_string = select_string.replace(
-                f'{self.aggregation_method}({col})', 
-                f'{self.aggregation_method}(\"{col}\") AS \"{self.aggregation_method}_{col}\"')
-            
+        return self.agg("mean")
+
+    def agg(self, methods):
+        """
+        Aggregates all columns with several methods at once.
+        All the aggregates are computed by the same GROUP BY query, so that
+        the table is scanned once instead of once per method, e.g. for a
+        summary of the groups with agg(["count", "min", "max", "mean"]).
+        The single methods, e.g. mean(), call agg with one method, so that
+        their query only computes the aggregates they return.
+
+        Parameters
+        ----------
+        methods : str or list of str
+            Aggregation methods, among 'count', 'sum', 'min', 'max' and
+            'mean'.
+
+        Returns
+        -------
+        IdaDataFrame
+            Object with grouped data, with the columns of the first method,
+            e.g. COUNT_<column>, followed by the columns of the next methods
+            and the column the data is grouped by.
+
+        Raises
+        ------
+        ValueError
+            If a method is not an aggregation method.
+
+        Examples
+        --------
+        >>> ida_iris[["SEPAL_LENGTH", "CLASS"]].groupby("CLASS").agg(["min", "max"]).head()
+            MIN_SEPAL_LENGTH    MAX_SEPAL_LENGTH    CLASS
+        0   4.3                 5.8                 Iris-setosa
+        1   4.9                 7.0                 Iris-versicolor
+        2   4.9                 7.9                 Iris-virginica
+        """
+        if isinstance(methods, six.string_types):
+            methods = [methods]
+        if not methods:
+            raise ValueError("methods must contain at least one method")
+        for method in methods:
+            if method not in _AGGREGATION_METHODS:
+                raise ValueError(f"'{method}' is not an aggregation method, " +
+                                 "valid methods are: " +
+                                 ", ".join(sorted(_AGGREGATION_METHODS)))
+        return self._execute_query(
+            [_AGGREGATION_METHODS[method] for method in methods])
+
+    def _execute_query(self, aggregation_methods):
+        select_string = ', '.join(
+            f'{method}(\"{col}\") AS \"{method}_{col}\"'
+            for method in aggregation_methods
+            for col in self.columns_to_aggregate)
+
         groupby_string = f'GROUP BY \"{self.by_column}\"'
         query = 'SELECT ' + select_string + f', \"{self.by_column}\"' + \
             f' FROM ({self.name}) AS TEMP_GB ' + groupby_string
@@ -4,6 +4,40 @@ from typing import List
 from nzpyida.analytics.utils import q
 import itertools
 
+# Types whose NULL can be cast without a length, precision or scale, which
+# would otherwise have to match the ones of the column
+_UNPARAMETERIZED_TYPES = {'BYTEINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'REAL',
+                          'DOUBLE', 'DOUBLE PRECISION', 'FLOAT', 'BOOLEAN',
+                          'DATE', 'TIME', 'TIMESTAMP'}
+
+def _typed_nulls(objs, columns_table, in_columns_table, quoted):
+    """
+    Returns the select list item of each column which is missing from some
+    of the objs, for these objs: NULL cast to the type of the column in the
+    first obj which has it, if it is a type without parameters, and an
+    untyped NULL otherwise. Only the dtypes of the objs owning a missing
+    column are read.
+    """
+    missing_columns = set()
+    for columns in columns_table:
+        missing_columns.update(columns)
+    missing_columns = set(col for col in missing_columns
+                          if not all(col in in_columns for in_columns in in_columns_table))
+    null_columns = {}
+    for obj, columns in zip(objs, columns_table):
+        owned_columns = [col for col in columns
+                         if col in missing_columns and col not in null_columns]
+        if not owned_columns:
+            continue
+        dtypes = obj.dtypes
+        for col in owned_columns:
+            column_type = dtypes.loc[col, 'TYPENAME'] if col in dtypes.index else None
+            if column_type in _UNPARAMETERIZED_TYPES:
+                null_columns[col] = f"CAST(NULL AS {column_type}) AS {quoted[col]}"
+            else:
+                null_columns[col] = "null AS " + quoted[col]
+    return null_columns
+
 def concat(objs: List[IdaDataFrame], axis: int=0, join: str='outer', keys: List[str]=None):
     """
     Implement pandas-like interface to concateate IdaDataFrames
@@ -62,30 +96,41 @@ def concat(objs: List[IdaDataFrame], axis: int=0, join: str='outer', keys: List[
     idx = None
     if axis == 0:
         if keys:
-            case_statments = [f" '{q(keys[i])}' as keys, " if i < len(keys) else f" '{q(keys[-1])}' as keys, "
-                               for i in range(len(objs))]
+            # The keys are string literals, not identifiers
+            quoted_keys = [" '" + str(key).replace("'", "''") + "' as keys, "
+                           for key in keys]
+            case_statments = [quoted_keys[min(i, len(keys) - 1)]
+                              for i in range(len(objs))]
         else:
             case_statments = [""] * len(objs)
-        if all(list(obj.columns) == list(objs[0].columns) for obj in objs):
+        # The columns of an IdaSeries are a list, not an Index
+        first_columns = list(objs[0].columns)
+        if all(list(obj.columns) == first_columns for obj in objs[1:]):
             names_list = [f'{objs[i].internal_state.get_state()} AS TEMP_JOIN_{i} ' for i in range(len(objs))]
             query = "SELECT * FROM " + " UNION ALL SELECT * FROM ".join(names_list)
         else:
-            in_columns_table = [obj.columns for obj in objs]
+            # The columns of each obj are listed once
+            columns_table = [list(obj.columns) for obj in objs]
+            in_columns_table = [set(columns) for columns in columns_table]
 
-            all_columns = list(dict.fromkeys(itertools.chain.from_iterable(in_columns_table)))
+            all_columns = list(dict.fromkeys(itertools.chain.from_iterable(columns_table)))
+            # Each column is quoted once, whatever the number of objs
+            quoted = {col: q(col) for col in all_columns}
             if join == 'inner':
-                output_columns = [q(col) for col in all_columns 
-                              if all([col in obj.columns for obj in objs])]
-                out_columns_table = [output_columns for _ in objs]
+                # The select list is the same for every obj
+                output_columns = ', '.join(
+                    quoted[col] for col in all_columns
+                    if all(col in in_columns for in_columns in in_columns_table))
+                out_columns_table = [output_columns] * len(objs)
                 
             else: 
+                null_columns = _typed_nulls(objs, columns_table, in_columns_table, quoted)
                 out_columns_table = [
-                    [q(col) if col in in_columns_list else "null AS " + q(col) 
-                        for col in all_columns] 
-                            for in_columns_list in in_columns_table]
+                    ', '.join(quoted[col] if col in in_columns_set else null_columns[col]
+                              for col in all_columns)
+                    for in_columns_set in in_columns_table]
                 
-            columns_queries = ['SELECT ' + case_statments[i] + 
-                                ', '.join(out_columns_table[i]) + 
+            columns_queries = ['SELECT ' + case_statments[i] + out_columns_table[i] +
                                 f" FROM ({objs[i].internal_state.get_state()}) AS TEMP_{i}" 
                                 for i in range(len(objs))
                                ]
@@ -95,14 +140,71 @@ def concat(objs: List[IdaDataFrame], axis: int=0, join: str='outer', keys: List[
         idadf = nzpyida.IdaDataFrame(idadb, objs[0].tablename, indexer=idx)
         idadf.internal_state._views.append(query)
     elif axis == 1:
-        idadf = objs[0] 
-        for i in range(1, len(objs)):
-            idadf = idadf.join(objs[i], how=join)
+        if (len(objs) > 2 and join in _INDEXER_JOIN_TYPES
+                and all(obj.indexer for obj in objs)):
+            idadf = _join_on_indexers(objs, join)
+        else:
+            idadf = objs[0]
+            for i in range(1, len(objs)):
+                idadf = idadf.join(objs[i], how=join)
     else:
         raise ValueError("Axis must be 0 or 1")
     return idadf
 
 
+# Join types for which the indexer of the first IdaDataFrame is the indexer
+# of the joined IdaDataFrames, so that further ones can be joined on it
+_INDEXER_JOIN_TYPES = {"inner": "inner", "left": "left outer"}
+
+def _join_on_indexers(objs: List[IdaDataFrame], how: str):
+    """
+    Joins IdaDataFrames on their indexers with a single query, with the
+    same result columns as joining them one by one with join(). The
+    query joins all the IdaDataFrames to the first one, so that its plan
+    covers all the joins, instead of nesting one query per join.
+    """
+    suffixes = ["_x", "_y"]
+    first = objs[0]
+    indexer = first.indexer
+    indexer_expression = f"TEMP_JOIN_0.{q(indexer)}"
+    # Name and expression of each result column, in the order of join()
+    columns = [(col, f"TEMP_JOIN_0.{q(col)}") for col in first.columns]
+    joins = []
+    for i in range(1, len(objs)):
+        obj = objs[i]
+        table = f"TEMP_JOIN_{i}"
+        obj_columns = list(obj.columns)
+        obj_columns_set = set(obj_columns)
+        left_names = set(col for col, _ in columns)
+        common_columns = left_names & obj_columns_set
+        if indexer == obj.indexer:
+            # Joined with "using", the indexer is selected once
+            lcols = [(indexer, indexer_expression)]
+            lcols += [(col + suffixes[0] if col in common_columns else col, expression)
+                      for col, expression in columns if col != indexer]
+            rcols = [(col + suffixes[1] if col in common_columns else col,
+                      f"{table}.{q(col)}")
+                     for col in obj_columns if col != indexer]
+        else:
+            lcols = [(col + suffixes[0] if col in common_columns else col, expression)
+                     for col, expression in columns]
+            rcols = [(col + suffixes[1] if col in common_columns else col,
+                      f"{table}.{q(col)}")
+                     for col in obj_columns]
+        columns = lcols + rcols
+        joins.append(f" {_INDEXER_JOIN_TYPES[how]} join ({obj.internal_state.get_state()}) " +
+                     f"AS {table} on {indexer_expression} = {table}.{q(obj.indexer)}")
+    cols = ", ".join(f"{expression} AS {q(col)}" for col, expression in columns)
+    query = (f"select {cols} from ({first.internal_state.get_state()}) AS TEMP_JOIN_0" +
+             "".join(joins))
+    if indexer not in set(col for col, _ in columns):
+        # The indexer was suffixed because a joined IdaDataFrame has a
+        # column with the same name
+        indexer = None
+    idadf = nzpyida.IdaDataFrame(first._idadb, first.tablename, indexer=indexer)
+    idadf.internal_state._views.append(query)
+    return idadf
+
 def merge(left: IdaDataFrame, right: IdaDataFrame, how: str='inner', on=None, 
           left_on=None, right_on=None, left_index: bool=False, 
           right_index: bool=False, suffixes: List[str]=["_x", "_y"],
@@ -173,7 +275,11 @@ def merge(left: IdaDataFrame, right: IdaDataFrame, how: str='inner', on=None,
     idadb = left._idadb
     suffixes = [suffix if suffix else "" for suffix in suffixes ]
     available_join_types = ["inner", "left", "right", "outer", "cross"]
-    common_columns =[col for col in left.columns if col in right.columns]
+    left_columns = list(left.columns)
+    right_columns = list(right.columns)
+    left_columns_set = set(left_columns)
+    right_columns_set = set(right_columns)
+    common_columns = [col for col in left_columns if col in right_columns_set]
     on_query = ""
     left_indexer = None
     right_indexer = None
@@ -191,18 +297,18 @@ def merge(left: IdaDataFrame, right: IdaDataFrame, how: str='inner', on=None,
                                  "left_index=False, right_index=False")
     if on:
         if isinstance(on, str):
-            if not on in left.columns:
+            if not on in left_columns_set:
                 raise KeyError(f"No column {on} in {left.name} dataframe")
-            if not on in right.columns:
+            if not on in right_columns_set:
                 raise KeyError(f"No column {on} in {right.name} dataframe")
             on_query = f" using ({q(on)})"
             left_indexer = on
             right_indexer = on
             on = [on]
         else:
-            if not all(on_col in left.columns for on_col in on):
+            if not all(on_col in left_columns_set for on_col in on):
                 raise KeyError(f"Not all on columns {on} in {left.name} dataframe")
-            if not all(on_col in right.columns for on_col in on):
+            if not all(on_col in right_columns_set for on_col in on):
                 raise KeyError(f"Not all on columns {on} in {right.name} dataframe")
             if len(on) == 1:
                 on_query = f" using ({q(on[0])})"
@@ -218,17 +324,17 @@ def merge(left: IdaDataFrame, right: IdaDataFrame, how: str='inner', on=None,
             raise ValueError("Can not pass on, right_on, left_on or set right_index=True or left_index=True")
         if left_on:
             if isinstance(left_on, str):
-                if not left_on in left.columns:
+                if not left_on in left_columns_set:
                     raise KeyError(f"No column {left_on} in {left.name} dataframe")
                 left_on = [left_on]
-            elif not all(left_on_col in left.columns for left_on_col in left_on):
+            elif not all(left_on_col in left_columns_set for left_on_col in left_on):
                 raise KeyError(f"Not all columns {left_on} in {left.name} dataframe")
         if right_on:
             if isinstance(right_on, str):
-                if not right_on in right.columns:
+                if not right_on in right_columns_set:
                     raise KeyError(f"No column {right_on} in {right.name} dataframe")
                 right_on = [right_on]
-            elif not all(right_on_col in right.columns for right_on_col in right_on):
+            elif not all(right_on_col in right_columns_set for right_on_col in right_on):
                 raise KeyError(f"Not all columns {right_on} in {right.name} dataframe")
         if left_on and len(left_on) > 1:
             if not right_on or len(right_on) != len(left_on):
@@ -262,29 +368,33 @@ def merge(left: IdaDataFrame, right: IdaDataFrame, how: str='inner', on=None,
                           for i in range(len(left_on))]
             on_query = " on " + " and ".join(on_queries)
         
-    lcols = [f"left_table.{q(lcol)}" if lcol not in common_columns 
-            else f"left_table.{q(lcol)} AS {q(lcol + suffixes[0])}" 
-            for lcol in left.columns]
-    rcols = [f"right_table.{q(rcol)}" if rcol not in common_columns 
-            else f"right_table.{q(rcol)} AS {q(rcol + suffixes[1])}" 
-            for rcol in right.columns]
-    nvl_statement = ""
-    if on and len(on) == 1: 
-        lcols.remove(f"left_table.{q(on[0])} AS {q(on[0] + suffixes[0])}")
-        rcols.remove(f"right_table.{q(on[0])} AS {q(on[0] + suffixes[1])}") 
-        all_cols = [q(on[0])] + lcols + rcols
-    else:  
-        if on:
-            for on_col in on:
-                lcols.remove(f"left_table.{q(on_col)} AS {q(on_col + suffixes[0])}")
-                rcols.remove(f"right_table.{q(on_col)} AS {q(on_col + suffixes[1])}")
-                nvl_statement += f" nvl(left_table.{q(on_col)},right_table.{q(on_col)}) AS {q(on_col)}, "
-        elif left_on and len(left_on) > 1:
-            for i in range(len(left_on)):
-                if left_on[i] == right_on[i]:
-                    lcols.remove(f"left_table.{q(left_on[i])} AS {q(left_on[i] + suffixes[0])}")
-                    rcols.remove(f"right_table.{q(right_on[i])} AS {q(right_on[i] + suffixes[1])}")
-                    nvl_statement += f" nvl(left_table.{q(left_on[i])},right_table.{q(right_on[i])}) AS {q(left_on[i])}, "
+    # The columns joined on, which are common to both sides, are selected
+    # once instead of once per side
+    if on:
+        joined_columns = list(on)
+    elif left_on and len(left_on) > 1:
+        joined_columns = [left_on[i] for i in range(len(left_on))
+                          if left_on[i] == right_on[i]]
+    else:
+        joined_columns = []
+    joined_columns_set = set(joined_columns)
+    common_columns_set = set(common_columns)
+
+    # Each column is quoted once
+    quoted = {col: q(col) for col in itertools.chain(left_columns, right_columns)}
+    lcols = [f"left_table.{quoted[lcol]}" if lcol not in common_columns_set
+            else f"left_table.{quoted[lcol]} AS {q(lcol + suffixes[0])}"
+            for lcol in left_columns if lcol not in joined_columns_set]
+    rcols = [f"right_table.{quoted[rcol]}" if rcol not in common_columns_set
+            else f"right_table.{quoted[rcol]} AS {q(rcol + suffixes[1])}"
+            for rcol in right_columns if rcol not in joined_columns_set]
+    if on and len(on) == 1:
+        nvl_statement = ""
+        all_cols = [quoted[on[0]]] + lcols + rcols
+    else:
+        nvl_statement = "".join(
+            f" nvl(left_table.{quoted[col]},right_table.{quoted[col]}) AS {quoted[col]}, "
+            for col in joined_columns)
         all_cols = lcols + rcols
     cols = ", ".join(all_cols)
 
@@ -295,23 +405,21 @@ def merge(left: IdaDataFrame, right: IdaDataFrame, how: str='inner', on=None,
         "outer": "full outer",
         "cross": "cross"
     }
+    left_state = left.internal_state.get_state()
+    right_state = right.internal_state.get_state()
     if indicator:
+        # t1 and t2 flag the rows of each side, so each side is wrapped
+        # once to add them
         case_statement = ", case when t1=1 and t2=1 then 'both' when t1=1 then 'left_only'" + \
             "else 'right_only' end as indicator"
-        select_statement1 = "(select 1 as t1, * from ("
-        select_statement2 = "(select 1 as t2, * from ("
-        as_statement1 = ") as lt) as left_table "
-        as_statement2 = ") as rt) as right_table "
+        left_table = f"(select 1 as t1, lt.* from ({left_state}) as lt) as left_table"
+        right_table = f"(select 1 as t2, rt.* from ({right_state}) as rt) as right_table"
     else:
         case_statement = ""
-        select_statement1 = "("
-        select_statement2 = "("
-        as_statement1 = ") as left_table"
-        as_statement2 = ") as right_table"
-    query = f"select {nvl_statement} {cols} {case_statement} from" + \
-        f"{select_statement1} ({left.internal_state.get_state()}){as_statement1}" + \
-        f" {join_type[how]} join {select_statement2}" + \
-        f"{right.internal_state.get_state()}{as_statement2}" + on_query
+        left_table = f"({left_state}) as left_table"
+        right_table = f"({right_state}) as right_table"
+    query = f"select {nvl_statement} {cols} {case_statement} from " + \
+        f"{left_table} {join_type[how]} join {right_table}" + on_query
 
     if how == 'right':
         idx = right_indexer
@@ -8,7 +8,25 @@
 #
 # The full license is in the LICENSE file, distributed with this software.
 #-----------------------------------------------------------------------------
-from .iris import iris
-from .swiss import swiss
-from .titanic import titanic 
-__all__ = ['iris', 'swiss', 'titanic']
\ No newline at end of file
+'''
+Sample data sets, as pandas DataFrames. Each one is read from its file on
+first access, e.g. by from nzpyida.sampledata import iris, so that importing
+the package doesn't read any of them.
+'''
+# The modules don't read their data set on import. Their names are removed
+# from the package, so that the data sets are returned by __getattr__
+# instead of the modules
+from . import iris as _iris, swiss as _swiss, titanic as _titanic
+del iris, swiss, titanic
+
+_MODULES = {'iris': _iris, 'swiss': _swiss, 'titanic': _titanic}
+
+__all__ = ['iris', 'swiss', 'titanic']
+
+def __getattr__(name):
+    if name in _MODULES:
+        data = getattr(_MODULES[name], name)
+        globals()[name] = data
+        return data
+    raise AttributeError("module " + repr(__name__) + " has no attribute " +
+                         repr(name))
\ No newline at end of file
@@ -25,4 +25,11 @@ Examples
 from os.path import dirname, join
 import pandas as pd
 
-iris = pd.read_csv(join(dirname(__file__), 'iris.txt'))
+def __getattr__(name):
+    # The data set is read on first access instead of on import
+    if name == 'iris':
+        global iris
+        iris = pd.read_csv(join(dirname(__file__), 'iris.txt'))
+        return iris
+    raise AttributeError("module " + repr(__name__) + " has no attribute " +
+                         repr(name))
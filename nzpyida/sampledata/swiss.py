@@ -28,4 +28,11 @@ Examples
 from os.path import dirname, join
 import pandas as pd
 
-swiss = pd.read_csv(join(dirname(__file__), 'swiss.txt'), index_col = 0)
\ No newline at end of file
+def __getattr__(name):
+    # The data set is read on first access instead of on import
+    if name == 'swiss':
+        global swiss
+        swiss = pd.read_csv(join(dirname(__file__), 'swiss.txt'), index_col = 0)
+        return swiss
+    raise AttributeError("module " + repr(__name__) + " has no attribute " +
+                         repr(name))
\ No newline at end of file
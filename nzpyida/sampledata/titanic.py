@@ -34,5 +34,12 @@ Examples
 from os.path import dirname, join
 import pandas as pd
 
-titanic = pd.read_csv(join(dirname(__file__), 'titanic.txt'), sep = '|')
-titanic.name = "titanic"
\ No newline at end of file
+def __getattr__(name):
+    # The data set is read on first access instead of on import
+    if name == 'titanic':
+        global titanic
+        titanic = pd.read_csv(join(dirname(__file__), 'titanic.txt'), sep = '|')
+        titanic.name = "titanic"
+        return titanic
+    raise AttributeError("module " + repr(__name__) + " has no attribute " +
+                         repr(name))
\ No newline at end of file
@@ -12,7 +12,7 @@
 """
 idaSeries
 """
-from copy import deepcopy
+from copy import copy
 
 from lazy import lazy
 
@@ -70,12 +70,18 @@ class IdaSeries(nzpyida.IdaDataFrame):
         """
         Clone an IdaSeries.
         """
-        newida = IdaSeries(self._idadb, self._name, self.indexer, self.column)
-        newida.internal_state.name = deepcopy(self.internal_state.name)
-        newida.internal_state.ascending = deepcopy(self.internal_state.ascending)
-        #newida.internal_state.views = deepcopy(self.internal_state.views)
-        newida.internal_state._views = deepcopy(self.internal_state._views)
-        newida.internal_state._cumulative = deepcopy(self.internal_state._cumulative)
-        newida.internal_state.order = deepcopy(self.internal_state.order)
+        # The table is the one of self, so that its name and existence don't
+        # need to be checked again
+        newida = IdaSeries.__new__(IdaSeries)
+        newida._init_attributes(self._idadb, self._name, self.indexer)
+        newida._column = self.column
+        # The internal state only holds strings, so copying the containers
+        # is enough to keep both objects independent, no deepcopy needed
+        state = self.internal_state
+        newida.internal_state.name = state.name
+        newida.internal_state.ascending = state.ascending
+        newida.internal_state._views = list(state._views)
+        newida.internal_state._cumulative = list(state._cumulative)
+        newida.internal_state.order = copy(state.order)
         newida._org_columns_names = self._org_columns_names
         return newida
\ No newline at end of file
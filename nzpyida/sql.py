@@ -11,12 +11,16 @@
 
 """ Utility functions """
 import decimal
+from functools import lru_cache
 import numpy as np
 import os
 
 import pandas as pd
 from pandas.io.sql import read_sql
 
+# ODBC connection attribute of the network packet size
+_SQL_ATTR_PACKET_SIZE = 112
+
 def _prepare_query(query_string, silent = False):
     """
     Return a formatted query string and print query if verbose mode activated
@@ -89,7 +93,12 @@ def _ida_query_ODBC_new(idadb, query, silent, first_row_only, autocommit):
     query = _prepare_query(query, silent)
 
     try:
-        result = read_sql(query, idadb._con)
+        result = None
+        if (idadb._arrow_odbc and first_row_only is not True and
+                idadb._con.autocommit and query.strip()[:6].upper() == "SELECT"):
+            result = _ida_query_ODBC_arrow(idadb, query)
+        if result is None:
+            result = read_sql(query, idadb._con)
         if first_row_only is True:
             if result.shape[0] > 0:
                 tuple_as_list = list(result.values[0])
@@ -125,6 +134,53 @@ def _ida_query_ODBC_new(idadb, query, silent, first_row_only, autocommit):
             raise e
 
 
+@lru_cache(maxsize=1)
+def _import_arrow_odbc():
+    """
+    Returns the arrow_odbc and pyarrow modules, or None if they are not
+    installed. The import is only attempted once.
+    """
+    try:
+        import arrow_odbc
+        import pyarrow
+    except ImportError:
+        return None
+    return arrow_odbc, pyarrow
+
+def _ida_query_ODBC_arrow(idadb, query):
+    """
+    Fetches the result of a SELECT query in columnar batches with
+    arrow-odbc, instead of one Python object per cell as read_sql does.
+    Returns None if arrow-odbc fails, e.g. on a column type that it doesn't
+    map to Arrow, so that the caller falls back on read_sql, which also
+    raises the errors of the query itself.
+
+    Notes
+    -----
+    arrow-odbc uses its own connection, opened on the first query with the
+    connection string and packet size of idadb and reused afterwards. That's
+    why it is only used when the connection of idadb is in autocommit mode:
+    the objects which the query refers to are then committed and visible
+    from another connection.
+    """
+    arrow_odbc, pyarrow = _import_arrow_odbc()
+    try:
+        if idadb._arrow_odbc_con is None:
+            idadb._arrow_odbc_con = arrow_odbc.connect(
+                idadb._connection_string,
+                packet_size=idadb._odbc_attrs_before.get(_SQL_ATTR_PACKET_SIZE))
+        # Text is decoded as utf-8, as for the connection of idadb
+        reader = idadb._arrow_odbc_con.read_arrow_batches(
+            query=query, batch_size=65536,
+            payload_text_encoding=arrow_odbc.TextEncoding.UTF8)
+        table = pyarrow.Table.from_batches(list(reader), schema=reader.schema)
+    except arrow_odbc.Error:
+        # The connection is opened again for the next query, in case it
+        # was the cause of the error
+        idadb._arrow_odbc_con = None
+        return None
+    return table.to_pandas(self_destruct=True)
+
 def _ida_query_ODBC(idadb, query, silent, first_row_only, autocommit):
     """
     For ODBC connections no further work needs to be done regarding
@@ -212,8 +268,10 @@ def _ida_query_NZPY(idadb, query, silent, first_row_only, autocommit):
                 if firstRow is None:
                     result = pd.DataFrame([], columns= colnames)
                 else:
+                    # The cursor is iterated, fetchall would first copy
+                    # the remaining rows into a tuple
                     data = [firstRow]
-                    data.extend(cursor.fetchall())
+                    data.extend(cursor)
                     result = pd.DataFrame(data, columns= colnames)
                 #convert to Series if only one column
                 if len(result.columns) == 1:
@@ -224,6 +282,22 @@ def _ida_query_NZPY(idadb, query, silent, first_row_only, autocommit):
     finally:
         cursor.close()
 
+# Number of rows fetched at once from a JDBC result set
+_JDBC_FETCH_SIZE = 1000
+
+# java.sql.Types.CLOB and java.sql.Types.NCLOB
+_JDBC_CLOB_TYPES = (2005, 2011)
+
+def _clob_to_str(rs, col):
+    """
+    jaydebeapi converter which returns the string of a CLOB column of the
+    current row of the result set rs, or None for NULL.
+    """
+    clob = rs.getClob(col)
+    if clob is None:
+        return None
+    return clob.getSubString(1, clob.length())
+
 def _ida_query_JDBC(idadb, query, silent, first_row_only, autocommit):
     """
     For JDBC connections, the CLOBs are retrieved as handles from which
@@ -239,9 +313,19 @@ def _ida_query_JDBC(idadb, query, silent, first_row_only, autocommit):
     for JDBC would be needed, as the CLOB would be retrieved as actual strings
     instead of handles.
     
-    If there are no CLOB columns, Pandas' read_sql method is used
+    That's why, when the cursor of jaydebeapi allows it, a converter which
+    extracts the strings of the CLOB columns while their row is current is
+    registered for it. The rows can then be fetched by batches, so that the
+    driver prefetches them instead of doing a round-trip per row.
+    Otherwise, the rows which contain CLOBs are fetched one by one.
     """
     cursor = idadb._con.cursor()
+    converters = getattr(cursor, '_converters', None)
+    if converters is not None:
+        converters = dict(converters)
+        for sqltype in _JDBC_CLOB_TYPES:
+            converters[sqltype] = _clob_to_str
+        cursor._converters = converters
     try:
         query = _prepare_query(query, silent)
         cursor.execute(query)
@@ -304,8 +388,11 @@ def _ida_query_JDBC(idadb, query, silent, first_row_only, autocommit):
                                     pass
                     result = pd.DataFrame(data, columns = colNames)
                 else:
-                    # fetch the remaining rows
-                    data.extend(cursor.fetchall())
+                    # fetch the remaining rows by batches
+                    rows = cursor.fetchmany(_JDBC_FETCH_SIZE)
+                    while rows:
+                        data.extend(rows)
+                        rows = cursor.fetchmany(_JDBC_FETCH_SIZE)
                     result = pd.DataFrame(data, columns= colNames)
 
                 #convert to Series if only one column
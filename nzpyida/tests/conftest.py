@@ -89,6 +89,8 @@ def pytest_addoption(parser):
         help="jdbc url string for JDBC connection")
     parser.addoption("--hostname", default='',
         help="hostname for nzpy connection")
+    parser.addoption("--odbc-packet-size", default=None, type=int,
+        help="network packet size for ODBC connection")
     parser.addoption("--esri", default='true',
         help="is working on nzspatial_esri cartridge")
 
@@ -153,7 +155,8 @@ def idadb(request):
             idadb = nzpyida.IdaDataBase(dsn=request.config.getoption('--dsn'),
                                         uid=request.config.getoption('--uid'),
                                         pwd=request.config.getoption('--pwd'),
-                                        autocommit=False)
+                                        autocommit=False,
+                                        odbc_packet_size=request.config.getoption('--odbc-packet-size'))
         except:
             raise
     return idadb
@@ -193,7 +196,8 @@ def idadb_tmp(request):
             idadb_tmp = nzpyida.IdaDataBase(dsn=request.config.getoption('--dsn'),
                                             uid=request.config.getoption('--uid'),
                                             pwd=request.config.getoption('--pwd'),
-                                            autocommit=False)
+                                            autocommit=False,
+                                            odbc_packet_size=request.config.getoption('--odbc-packet-size'))
         except:
             raise
     return idadb_tmp
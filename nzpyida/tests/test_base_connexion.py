@@ -55,6 +55,28 @@ class Test_ConnectToDB(object):
             with pytest.raises(IdaDataBaseError):
                 IdaDataBase(dsn = 'jdbc:db2://awh-yp-small03.services.dal.bluemix.net:50000/BLUDB')
 
+    def test_idadb_arrow_odbc(self, idadb, request):
+        pytest.importorskip('arrow_odbc')
+        if idadb._con_type != 'odbc':
+            pytest.skip("arrow-odbc is only used with ODBC connections")
+        idadb_arrow = IdaDataBase(dsn=request.config.getoption('--dsn'),
+                                  uid=request.config.getoption('--uid'),
+                                  pwd=request.config.getoption('--pwd'),
+                                  autocommit=True, arrow_odbc=True)
+        try:
+            query = "SELECT OBJID, OBJNAME FROM _V_OBJECT ORDER BY OBJID LIMIT 10"
+            result = idadb_arrow.ida_query(query)
+            # The result was fetched with arrow-odbc, whose connection is kept
+            assert idadb_arrow._arrow_odbc_con is not None
+            expected = idadb.ida_query(query)
+            assert list(result.columns) == list(expected.columns)
+            assert list(result.iloc[:, 1]) == list(expected.iloc[:, 1])
+            assert isinstance(idadb_arrow.ida_query(
+                "SELECT OBJNAME FROM _V_OBJECT LIMIT 10"), pandas.Series)
+        finally:
+            idadb_arrow.close()
+        assert idadb_arrow._arrow_odbc_con is None
+
 
 class Test_ConnexionManagement(object):
 
@@ -434,6 +434,26 @@ class Test_DataExploration(object):
         assert isinstance(grouped_idadf, nzpyida.IdaDataFrame)
         assert any([col.startswith("AVG_") for col in grouped_idadf.columns])
 
+    def test_groupby_agg(self, idadf):
+        groupby_object = idadf.groupby("species")
+        grouped_idadf = groupby_object.agg(["min", "mean"])
+        assert isinstance(grouped_idadf, nzpyida.IdaDataFrame)
+        columns = list(grouped_idadf.columns)
+        assert any([col.startswith("MIN_") for col in columns])
+        assert any([col.startswith("AVG_") for col in columns])
+        assert columns[-1] == "species"
+        with pytest.raises(ValueError):
+            groupby_object.agg("median")
+
+    def test_groupby_methods_single_aggregate(self, idadf):
+        groupby_object = idadf.groupby("species")
+        for method, prefix in [("count", "COUNT_"), ("sum", "SUM_"),
+                               ("min", "MIN_"), ("max", "MAX_"),
+                               ("mean", "AVG_")]:
+            columns = list(getattr(groupby_object, method)().columns)
+            assert columns[:-1]
+            assert all([col.startswith(prefix) for col in columns[:-1]])
+
 # no test
 #__enter__
 #__exit__
@@ -26,6 +26,7 @@ from nzpyida import IdaGeoSeries
 
 GEO_TABLE_NAME1 = "GEO_TEST_TABLE1"
 GEO_TABLE_NAME2 = "GEO_TEST_TABLE2"
+GEO_TABLE_NAME_EMPTY = "GEO_TEST_TABLE_EMPTY"
 GEO_COLUMN_NAME = "THE_GEOM"
 INDEXER_COLUMN = "OBJECTID"
 VARCHAR_COLUMN = "NAME"
@@ -65,6 +66,20 @@ INSERT INTO {GEO_TABLE_NAME2} VALUES
         idadb, GEO_TABLE_NAME2, indexer=INDEXER_COLUMN), geometry=GEO_COLUMN_NAME)
     idadb.ida_query(f"DROP TABLE {GEO_TABLE_NAME2} IF EXISTS")
 
+@pytest.fixture(scope='module')
+def idageodf_empty(idadb, is_esri):
+    COLUMN_TYPE = "ST_GEOMETRY" if is_esri else "VARCHAR"
+    prep_table_commands = f"""
+DROP TABLE {GEO_TABLE_NAME_EMPTY} IF EXISTS;
+CREATE TABLE {GEO_TABLE_NAME_EMPTY} ("{INDEXER_COLUMN}"  INTEGER, "{GEO_COLUMN_NAME}" {COLUMN_TYPE}(200));
+INSERT INTO {GEO_TABLE_NAME_EMPTY} VALUES 
+(1, inza..ST_WKTToSQL('POLYGON EMPTY'));
+"""
+    idadb.ida_query(prep_table_commands)
+    yield IdaGeoDataFrame(idadb, GEO_TABLE_NAME_EMPTY,
+                          indexer=INDEXER_COLUMN, geometry=GEO_COLUMN_NAME)
+    idadb.ida_query(f"DROP TABLE {GEO_TABLE_NAME_EMPTY} IF EXISTS")
+
 class Test_IdaGeoDataFrame(object):
     def test_idageodf_set_geometry_error(self, idageodf1):
         with pytest.raises(KeyError):
@@ -77,6 +92,8 @@ class Test_IdaGeoDataFrame(object):
     def test_idageodf_set_geometry_success(self, idageodf1):
         assert(isinstance(idageodf1.geometry, IdaGeoSeries))
         assert(idageodf1.geometry.column == GEO_COLUMN_NAME)
+        # Each access returns a new IdaGeoSeries
+        assert idageodf1.geometry is not idageodf1.geometry
 
     def test_idageodf_nondestructive_geometry_column_deletion(
             self, idageodf1):
@@ -86,6 +103,13 @@ class Test_IdaGeoDataFrame(object):
         with pytest.raises(AttributeError):
             ida_spare.geometry
 
+    def test_idageodf_geometry_column_deleted_by_idadb(self, idadb, idageodf1):
+        ida_spare = idageodf1[[INDEXER_COLUMN, VARCHAR_COLUMN, GEO_COLUMN_NAME]]
+        assert(ida_spare.geometry.column == GEO_COLUMN_NAME)
+        idadb.delete_column(ida_spare, GEO_COLUMN_NAME)
+        with pytest.raises(KeyError):
+            ida_spare.geometry
+
     def test_idageodf_fromIdaDataFrame(self, idageodf2):
         assert(isinstance(idageodf2, IdaGeoDataFrame))
 
@@ -117,6 +141,12 @@ class Test_IdaGeoDataFrame(object):
         with pytest.raises(AttributeError):
             ida.geometry
 
+    def test_idageodf_select_geometries(self, idageodf1):
+        ida = idageodf1.select_geometries()
+        assert(isinstance(ida, IdaGeoDataFrame))
+        assert(list(ida.columns) == [INDEXER_COLUMN, GEO_COLUMN_NAME])
+        assert(ida.geometry.column == GEO_COLUMN_NAME)
+
     def test_idageodf_geospatial_method_call_carried_on_IdaGeoSeries(
             self, idageodf1):
         attribute = 'area'
@@ -133,6 +163,15 @@ class Test_IdaGeoDataFrame(object):
         assert (isinstance(ida, IdaGeoDataFrame))
         assert len(ida.head())
 
+    def test_idageodf_equals_empty_geometries(self, idageodf_empty):
+        ida = idageodf_empty.equals(idageodf_empty)
+        assert ida.head()['RESULT'].tolist() == [1]
+
+    def test_idageodf_difference_empty_geometries(self, idageodf_empty, idageodf2):
+        # ST_DIFFERENCE is called, the empty geometry is not passed through
+        ida = idageodf_empty.difference(idageodf2)
+        assert ida.head()['RESULT'].isnull().all()
+
     def test_idageodf_distance(self, idageodf1,idageodf2):
         ida = idageodf1.distance(idageodf2)
         assert (isinstance(ida, IdaGeoDataFrame))
@@ -193,6 +232,96 @@ class Test_IdaGeoDataFrame(object):
         assert (isinstance(ida, IdaGeoDataFrame))
         assert len(ida.head())
 
+    def test_idageodf_binary_ops(self, idageodf1, idageodf2):
+        ida = idageodf1.binary_ops(idageodf2, ['intersects', 'touches', 'distance'])
+        assert (isinstance(ida, IdaGeoDataFrame))
+        assert list(ida.columns) == ['INDEXERIDA1', 'INDEXERIDA2',
+            'RESULT_INTERSECTS', 'RESULT_TOUCHES', 'RESULT_DISTANCE']
+        assert len(ida.head())
+
+    def test_idageodf_binary_ops_intersecting_mbrs_only(self, idageodf1, idageodf2):
+        ida = idageodf1.binary_ops(idageodf2, ['intersection'],
+                                   intersecting_mbrs_only=True)
+        assert (isinstance(ida, IdaGeoDataFrame))
+        assert len(ida.head())
+        assert ida.shape[0] < idageodf1.shape[0] * idageodf2.shape[0]
+
+    def test_idageodf_binary_ops_invalid_operation(self, idageodf1, idageodf2):
+        with pytest.raises(ValueError):
+            idageodf1.binary_ops(idageodf2, ['area'])
+
+    def test_idageodf_drop_empty(self, idageodf2):
+        ida = idageodf2.drop_empty()
+        assert(isinstance(ida, IdaGeoDataFrame))
+        assert(ida.geometry.column == GEO_COLUMN_NAME)
+        # The geometries of the fixture are neither None nor empty
+        assert ida.shape[0] == idageodf2.shape[0]
+
+    def test_idageodf_geometry_srid(self, idadb, idageodf2):
+        srid = idageodf2._geometry_srid()
+        assert srid is not None
+        assert idadb.cache_geo_column_srids[
+            (idageodf2.name, GEO_COLUMN_NAME)] == srid
+        # No row to read the identifier from, nothing is cached
+        no_rows = idageodf2[idageodf2[INDEXER_COLUMN] < 0]
+        assert no_rows._geometry_srid() is None
+        assert (no_rows.name, GEO_COLUMN_NAME) not in idadb.cache_geo_column_srids
+
+    def test_idageodf_unary_ops(self, idageodf2):
+        ida = idageodf2.unary_ops(['min_x', 'max_x', 'area'])
+        data = ida.head()
+        assert list(data.columns) == [INDEXER_COLUMN, GEO_COLUMN_NAME,
+            'RESULT_MIN_X', 'RESULT_MAX_X', 'RESULT_AREA']
+        assert len(data)
+        with pytest.raises(ValueError):
+            idageodf2.unary_ops(['buffer'])
+
+    def test_idageodf_unary_ops_by_column(self, idageodf2):
+        ida = idageodf2.unary_ops({GEO_COLUMN_NAME: ['min_x', 'area']})
+        data = ida.head()
+        assert list(data.columns) == [INDEXER_COLUMN, GEO_COLUMN_NAME,
+            'RESULT_' + GEO_COLUMN_NAME + '_MIN_X',
+            'RESULT_' + GEO_COLUMN_NAME + '_AREA']
+        assert len(data)
+        with pytest.raises(KeyError):
+            idageodf2.unary_ops({'NOT_A_COLUMN': ['area']})
+
+    def test_idageodf_accessors(self, idageodf2):
+        ida = idageodf2.accessors(['num_points', 'area'])
+        assert(isinstance(ida, IdaDataFrame))
+        assert list(ida.columns) == [INDEXER_COLUMN, 'NUM_POINTS', 'AREA']
+        data = ida.head()
+        assert list(data.columns) == [INDEXER_COLUMN, 'NUM_POINTS', 'AREA']
+        assert len(data)
+        with pytest.raises(ValueError):
+            idageodf2.accessors(['buffer'])
+
+    def test_idageodf_bounds(self, idageodf2):
+        ida = idageodf2.bounds()
+        assert(isinstance(ida, IdaDataFrame))
+        data = ida.head()
+        assert list(data.columns) == [INDEXER_COLUMN, 'MIN_X', 'MIN_Y',
+            'MAX_X', 'MAX_Y']
+        assert len(data)
+
+    def test_idageodf_batch(self, idageodf1, idageodf2):
+        with idageodf1.batch(idageodf2) as batch:
+            assert batch.intersection() == 'RESULT_INTERSECTION'
+            assert batch.union() == 'RESULT_UNION'
+        assert (isinstance(batch.result, IdaGeoDataFrame))
+        assert list(batch.result.columns) == ['INDEXERIDA1', 'INDEXERIDA2',
+            'RESULT_INTERSECTION', 'RESULT_UNION']
+        assert len(batch.result.head())
+
+    def test_idageodf_stream(self, idageodf1, idageodf2):
+        ida = idageodf1.intersection(idageodf2)
+        chunks = list(ida.stream(chunksize=2))
+        assert all(len(chunk) <= 2 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == ida.shape[0]
+        assert list(chunks[0].columns) == list(ida.columns)
+        with pytest.raises(ValueError):
+            ida.stream(chunksize=0)
+
     def test_idageodf_binary_operation_handler_non_geometry_column(
             self, idageodf1,idageodf2):
         with pytest.raises(TypeError):
@@ -201,6 +330,16 @@ class Test_IdaGeoDataFrame(object):
                 db2gse_function='inza..ST_AGEOSPATIALFUNCTION',
                 valid_types=['ST_POINT'])
 
+    def test_idageodf_derived_columns(self, idageodf2):
+        ida = idageodf2[[INDEXER_COLUMN, GEO_COLUMN_NAME]]
+        ida['CENTROID'] = ida.centroid()
+        ida['AREA'] = ida.area()
+        ida['PERIMETER'] = ida.perimeter()
+        data = ida.head()
+        assert list(data.columns) == [INDEXER_COLUMN, GEO_COLUMN_NAME,
+            'CENTROID', 'AREA', 'PERIMETER']
+        assert len(data)
+
     def test_idageodf_max_distance(self, idageodf1, idageodf2):
          res = idageodf1.distance(idageodf2, 'kilometer')
          assert res['RESULT'].max()
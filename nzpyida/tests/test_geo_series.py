@@ -12,6 +12,9 @@
 """
 Test module for IdaGeoSeries
 """
+import struct
+from decimal import Decimal
+
 import pandas
 import pytest
 import six
@@ -19,7 +22,10 @@ from nzpy.core import ProgrammingError
 
 from nzpyida import IdaSeries
 from nzpyida import IdaGeoSeries
+from nzpyida import IdaGeoDataFrame
 from nzpyida.exceptions import IdaGeoDataFrameError
+from nzpyida.geo_series import (_geometry_type_cache_key, _UNARY_OPERATIONS,
+                                _wkb_point_coordinates)
 
 GEO_SERIES_NAME = "GEO_TEST_SERIES"
 GEO_COLUMN_NAME = "THE_GEOM"
@@ -47,15 +53,76 @@ class Test_IdaGeoSeries(object):
     def test_idageoseries_buffer(self, idageoseries):
         with pytest.raises(TypeError):
             idageoseries.buffer(distance='not a number')
+        with pytest.raises(TypeError):
+            idageoseries.buffer(distance=1j)
+        with pytest.raises(ValueError):
+            idageoseries.buffer(distance=10**400)
+        with pytest.raises(ValueError):
+            idageoseries.buffer(distance=float('nan'))
+        assert 'ST_BUFFER' in idageoseries.buffer(distance=Decimal('0.5')).column
+        ida = idageoseries.buffer(distance=0)
+        assert(isinstance(ida, IdaGeoSeries))
+        assert 'ST_BUFFER' in ida.column
+        assert len(ida.head()) == 3
         # TODO: ERROR:  SPU job process terminated (Segmentation fault)
         # assert(isinstance(idageoseries.buffer(distance=2.3), IdaGeoSeries))
         # assert len(ida.head())
 
+    def test_idageoseries_buffer_mixed_geometries(self, idadb, is_esri):
+        # The first row is a polygon, the others are not
+        COLUMN_TYPE = "ST_GEOMETRY" if is_esri else "VARCHAR"
+        idadb.ida_query(f"""
+DROP TABLE {GEO_SERIES_NAME}_MIXED IF EXISTS;
+CREATE TABLE {GEO_SERIES_NAME}_MIXED ("{INDEXER_COLUMN}"  INTEGER, "{GEO_COLUMN_NAME}" {COLUMN_TYPE}(200));
+INSERT INTO {GEO_SERIES_NAME}_MIXED VALUES
+(1, inza..ST_WKTToSQL('POLYGON ((1 1, 2 1, 2 2, 1 2, 1 1))'));
+INSERT INTO {GEO_SERIES_NAME}_MIXED VALUES
+(2, inza..ST_WKTToSQL('POINT (1 1)'));
+INSERT INTO {GEO_SERIES_NAME}_MIXED VALUES
+(3, inza..ST_WKTToSQL('LINESTRING (1 1, 2 2)'));
+""")
+        try:
+            mixed = IdaGeoSeries(idadb, GEO_SERIES_NAME + '_MIXED',
+                                 indexer=INDEXER_COLUMN, column=GEO_COLUMN_NAME)
+            ida = mixed.buffer(distance=0)
+            assert 'ST_BUFFER' in ida.column
+            assert len(ida.head()) == 3
+        finally:
+            idadb.ida_query(f"DROP TABLE {GEO_SERIES_NAME}_MIXED IF EXISTS")
+
+    def test_idageoseries_result_column_data_type(self, idageoseries):
+        ida = idageoseries.envelope()
+        assert(isinstance(ida, IdaGeoSeries))
+        # Probed on first use only
+        assert 'column_data_type' not in ida.__dict__
+        assert ida.column_data_type.startswith('ST_')
+
+    def test_idageoseries_chained_result_not_probed(self, idageoseries):
+        ida = idageoseries.envelope()
+        for method in ('convex_hull', 'boundary', 'mbr'):
+            assert isinstance(getattr(ida, method)(), IdaGeoSeries)
+        # The methods have no valid types, the calling series is not probed
+        assert 'column_data_type' not in ida.__dict__
+
+    def test_idageoseries_head_without_indexer(self, idadb, idageoseries):
+        ida = IdaGeoSeries(idadb, GEO_SERIES_NAME, indexer=None,
+                           column=GEO_COLUMN_NAME)
+        assert len(ida.head()) == 3
+        assert len(ida.centroid().head(2)) == 2
+
     def test_idageoseries_centroid(self, idageoseries):
         ida = idageoseries.centroid()
         assert(isinstance(ida, IdaGeoSeries))
         assert len(ida.head())
 
+    def test_idageoseries_geometry_type_cache(self, idageoseries, idadb):
+        ida = idageoseries.envelope()
+        cache_key = _geometry_type_cache_key(ida, ida.column)
+        assert cache_key in idadb.cache_geo_column_types
+        # A second call reuses the probed type
+        ida2 = idageoseries.envelope()
+        assert ida2.column_data_type == ida.column_data_type
+
     def test_idageoseries_convex_hull(self, idageoseries):
         ida = idageoseries.convex_hull()
         assert(isinstance(ida, IdaGeoSeries))
@@ -101,6 +168,71 @@ class Test_IdaGeoSeries(object):
         assert(isinstance(ida, IdaSeries))
         assert len(ida.head())
 
+    def test_idageoseries_as_binary(self, idageoseries):
+        ida = idageoseries.as_binary()
+        assert(isinstance(ida, IdaSeries))
+        assert len(ida.head())
+
+    def test_idageoseries_fetch_ops(self, idageoseries):
+        data = idageoseries.fetch_ops(['max_x', 'max_y', 'area'])
+        assert list(data.columns) == [INDEXER_COLUMN, 'max_x', 'max_y', 'area']
+        assert len(data) == idageoseries.shape[0]
+        with pytest.raises(ValueError):
+            idageoseries.fetch_ops(['buffer'])
+
+    def test_idageoseries_to_numpy(self, idageoseries):
+        values = idageoseries.to_numpy('max_x')
+        assert sorted(values.tolist()) == [-1.0, 2.0, 11.0]
+        with pytest.raises(ValueError):
+            idageoseries.to_numpy('buffer')
+
+    def test_idageoseries_to_wkb_array(self, idageoseries):
+        wkb = idageoseries.to_wkb_array()
+        assert len(wkb) == idageoseries.shape[0]
+        assert all(isinstance(value, bytes) for value in wkb)
+        assert "_wkb_values" in idageoseries.__dict__
+        assert list(idageoseries.to_wkb_array()) == list(wkb)
+        values = idageoseries.__dict__["_wkb_values"]
+        assert list(idageoseries.to_wkb_array(refresh=True)) == list(wkb)
+        assert idageoseries.__dict__["_wkb_values"] is not values
+
+    def test_idageoseries_point_coordinates(self, idageoseries):
+        # The geometries of the fixture are polygons
+        with pytest.raises(TypeError):
+            idageoseries.point_coordinates()
+        ida = idageoseries.centroid()
+        coordinates = ida.point_coordinates()
+        assert coordinates.shape == (3, 4)
+        assert [1.5, 1.5] in coordinates[:, :2].tolist()
+
+    def test_idageoseries_polygon_shape_stats(self, idageoseries):
+        if idageoseries.column_data_type != 'ST_POLYGON':
+            with pytest.raises(TypeError):
+                idageoseries.polygon_shape_stats()
+        else:
+            data = idageoseries.polygon_shape_stats()
+            assert list(data.columns)[-2:] == ['num_points',
+                                               'num_interior_ring']
+            assert len(data)
+
+    def test_idageoseries_total_bounds(self, idageoseries):
+        bounds = idageoseries.total_bounds()
+        assert bounds.shape == (4,)
+        assert bounds[0] <= bounds[2] and bounds[1] <= bounds[3]
+        assert bounds[2] == idageoseries.to_numpy('max_x').max()
+
+    def test_idageoseries_wkb_coord_dim(self, idageoseries):
+        dimensions = idageoseries.wkb_coord_dim()
+        assert dimensions.tolist() == [2.0, 2.0, 2.0]
+
+    def test_wkb_point_coordinates(self):
+        point = struct.pack('<BIdd', 1, 1, 1.0, 2.0)
+        assert _wkb_point_coordinates(point)[:2] == [1.0, 2.0]
+        point_zm = struct.pack('>BIdddd', 0, 3001, 1.0, 2.0, 3.0, 4.0)
+        assert _wkb_point_coordinates(point_zm) == [1.0, 2.0, 3.0, 4.0]
+        with pytest.raises(ValueError):
+            _wkb_point_coordinates(struct.pack('<BII', 1, 3, 0))
+
     def test_idageoseries_area(self, idageoseries):
         ida = idageoseries.area(unit='foot')
         assert(isinstance(ida, IdaSeries))
@@ -125,6 +257,34 @@ class Test_IdaGeoSeries(object):
         # TODO
         pass
 
+    def test_idageoseries_explode(self, idageoseries):
+        # The geometries of the fixture are polygons, not collections
+        with pytest.raises(TypeError):
+            idageoseries.explode()
+
+    def test_idageoseries_explode_multilinestrings(self, idadb, is_esri):
+        COLUMN_TYPE = "ST_GEOMETRY" if is_esri else "VARCHAR"
+        idadb.ida_query(f"""
+DROP TABLE {GEO_SERIES_NAME}_MLINES IF EXISTS;
+CREATE TABLE {GEO_SERIES_NAME}_MLINES ("{INDEXER_COLUMN}"  INTEGER, "{GEO_COLUMN_NAME}" {COLUMN_TYPE}(400));
+INSERT INTO {GEO_SERIES_NAME}_MLINES VALUES
+(1, inza..ST_WKTToSQL('MULTILINESTRING ((0 0, 1 1), (1 1, 2 2), (2 2, 3 3))'));
+INSERT INTO {GEO_SERIES_NAME}_MLINES VALUES
+(2, inza..ST_WKTToSQL('MULTILINESTRING ((5 5, 6 6))'));
+""")
+        try:
+            mlines = IdaGeoDataFrame(idadb, GEO_SERIES_NAME + '_MLINES',
+                                     indexer=INDEXER_COLUMN, geometry=GEO_COLUMN_NAME)
+            # The series of a frame only selects its column
+            lines = mlines.geometry.explode()
+            result = lines.head(10).sort_values([INDEXER_COLUMN, 'GEOMETRY_INDEX'])
+            assert len(result) == 4
+            assert result[INDEXER_COLUMN].tolist() == [1, 1, 1, 2]
+            assert result['GEOMETRY_INDEX'].tolist() == [1, 2, 3, 1]
+            assert lines.geometry.column_data_type == 'ST_LINESTRING'
+        finally:
+            idadb.ida_query(f"DROP TABLE {GEO_SERIES_NAME}_MLINES IF EXISTS")
+
     def test_idageoseries_num_interior_ring(self, idageoseries):
         ida = idageoseries.num_interior_ring()
         assert(isinstance(ida, IdaSeries))
@@ -229,6 +389,16 @@ class Test_IdaGeoSeries(object):
         assert(isinstance(ida, IdaSeries))
         assert len(ida.head())
     
+    def test_idageoseries_unary_operations(self, idageoseries):
+        # Every registered operation can be called without argument
+        for operation in _UNARY_OPERATIONS:
+            try:
+                ida = getattr(idageoseries, operation)()
+            except TypeError:
+                # The operation doesn't accept polygons
+                continue
+            assert(isinstance(ida, IdaSeries))
+
     def test_idageoseries_check_linear_unit(self, idageoseries):
         with pytest.raises(TypeError):
             idageoseries._check_linear_unit(10)
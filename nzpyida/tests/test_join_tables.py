@@ -52,6 +52,15 @@ class TestMerge:
         assert all(idadf_iris2.index == ida_nzpyida_join.index)
         assert idadf_iris2.indexer == ida_nzpyida_join.indexer
 
+    def test_join_derived_tables(self, idadf_iris, idadf_iris2):
+        for indicator in (False, True):
+            ida_nzpyida_join = nzpyida.merge(idadf_iris, idadf_iris2, on='index',
+                                             indicator=indicator)
+            query = ida_nzpyida_join.internal_state._views[-1]
+            assert query.count("(") == query.count(")")
+            assert ("as lt" in query) == indicator
+            assert len(ida_nzpyida_join) == 150
+
     def test_outer_join(self, idadf_iris, idadf_iris2):
         ida_nzpyida_join = idadf_iris.merge(idadf_iris2, how='outer', left_index=True, right_on='index')
         assert len(ida_nzpyida_join) == 200
@@ -168,6 +177,11 @@ class TestConcat:
                                                  'petal_length', 'petal_width', 'species', 
                                                  'PETAL_WIDTH', "SPECIES"])
         assert ida_nzpyida_union.indexer == 'KEYS'
+
+    def test_keys_values(self, idadf_iris, idadf_iris2, idadb):
+        ida_nzpyida_union = nzpyida.concat([idadf_iris, idadf_iris2], keys=['a', "b'c"])
+        keys = ida_nzpyida_union.unique(idadb.to_def_case('keys'))
+        assert sorted(keys) == ['a', "b'c"]
     
     def test_inner_join(self, idadf_iris, idadf_iris2):
         ida_nzpyida_union = nzpyida.concat([idadf_iris, idadf_iris2], join='inner')
@@ -180,6 +194,14 @@ class TestConcat:
         assert len(ida_nzpyida_union) == len(idadf_iris) + len(idadf_iris2) + len(idadf)
         assert all(ida_nzpyida_union.columns == ['sepal_length', 'sepal_width', 'petal_length'])
     
+    def test_series(self, idadf_iris):
+        # The columns of an IdaSeries are a list
+        series = idadf_iris['sepal_length']
+        ida_nzpyida_union = nzpyida.concat([series, series])
+        assert len(ida_nzpyida_union) == 2 * len(idadf_iris)
+        ida_nzpyida_union = nzpyida.concat([series, idadf_iris[['sepal_length']]])
+        assert len(ida_nzpyida_union) == 2 * len(idadf_iris)
+
     def test_objs_not_sequence(self, idadf_iris):
         with pytest.raises(ValueError) as e:
             nzpyida.concat(idadf_iris)
@@ -198,6 +220,16 @@ class TestConcat:
                                                 'species', 'sepal_length_y', 'sepal_width_y',
                                                 'petal_length_y', 'PETAL_WIDTH', 'SPECIES',
                                                 ])
+
+    def test_inner_join_axis_1_three_dataframes(self, idadf_iris, idadf_iris2):
+        ida_nzpyida_join = nzpyida.concat([idadf_iris, idadf_iris2, idadf_iris],
+                                          axis=1, join='inner')
+        ida_nzpyida_fold = idadf_iris.join(idadf_iris2, how='inner').join(
+            idadf_iris, how='inner')
+        assert len(ida_nzpyida_join.internal_state._views) == 1
+        assert list(ida_nzpyida_join.columns) == list(ida_nzpyida_fold.columns)
+        assert len(ida_nzpyida_join) == len(ida_nzpyida_fold)
+        assert ida_nzpyida_join.indexer == idadf_iris.indexer
     
 class TestJoin:
     def test_join_on(self, idadf_iris, idadf_iris2):
@@ -298,7 +298,15 @@ def _reset_attributes(idaobject, attributes):
     """
     if (not hasattr(attributes, "__iter__"))|isinstance(attributes, six.string_types):
         attributes = [attributes]
+    instance_dict = getattr(idaobject, '__dict__', None)
     for attribute in attributes:
+        descriptor = getattr(type(idaobject), attribute, None)
+        if instance_dict is not None and not hasattr(descriptor, '__delete__'):
+            # Lazy attributes are stored in the instance dict: they are
+            # removed without raising AttributeError when not evaluated yet
+            instance_dict.pop(attribute, None)
+            continue
+        # Properties are deleted through their deleter, e.g. columns
         try:
             delattr(idaobject, attribute)
         except AttributeError:
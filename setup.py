@@ -70,6 +70,9 @@ setup(name='nzpyida',
 
       extras_require={
         'jdbc':['JayDeBeApi==1.*', 'Jpype1==0.6.3'],
+        'numba':['numba'],
+        'arrow':['pyarrow'],
+        'arrow_odbc':['arrow-odbc>=10', 'pyarrow'],
         'test':['pytest', 'flaky==3.4.0'],
         'doc':['sphinx', 'ipython', 'numpydoc', 'sphinx_rtd_theme']
       },